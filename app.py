@@ -5,26 +5,92 @@ Provides web interface for HR to review CV analysis.
 """
 
 import os
+
+# Eventlet and gevent must patch the standard library before anything else is
+# imported, so this reads the real environment rather than .env
+ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'threading')
+if ASYNC_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+elif ASYNC_MODE == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+
 import logging
 import tempfile
 import time
+import re
+import signal
+import functools
+import uuid
+import gzip
+import hashlib
+import queue
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field, asdict
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-from flask import Flask, request, jsonify, render_template, send_file
+from flask import Flask, request, jsonify, render_template, send_file, make_response
+from flask.json.provider import DefaultJSONProvider
 from flask_socketio import SocketIO, emit, join_room
 from werkzeug.utils import secure_filename
+from werkzeug.exceptions import RequestEntityTooLarge
+from urllib.parse import unquote
 import threading
-import queue
+from collections import deque
+from operator import attrgetter
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from cachetools import LRUCache
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from streaming_form_data import StreamingFormDataParser
+    from streaming_form_data.targets import FileTarget, ValueTarget
+except ImportError:
+    StreamingFormDataParser = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+try:
+    from markdown_it import MarkdownIt
+    markdown_renderer = MarkdownIt('commonmark', {'html': False}).enable(['table'])
+except ImportError:
+    import markdown
+    markdown_renderer = None
 
 # Import the core analysis functions
 from main import load_cv_file
 from src.orchestrator.workflow import run_analysis
+from src.orchestrator.worker import init_worker, run_workflow
+from src.cache.analysis_cache import AnalysisCache, cache_key
+from src.cache.session_store import SessionStore
+
+# The health check reports whether the full workflow could be loaded
+try:
+    from src.orchestrator.workflow import CVAnalysisWorkflow
+    WORKFLOW_IMPORT_ERROR = None
+except Exception as e:
+    WORKFLOW_IMPORT_ERROR = str(e)
 
 # Set up basic logging
 logging.basicConfig(
@@ -33,110 +99,488 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True)
+class Settings:
+    """Server settings read from the environment once at startup."""
+    port: int
+    reports_dir: Path
+    is_production: bool
+    debug: bool
+    
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        return cls(
+            port=int(os.environ.get('PORT', 5001)),  # Use port 5001 by default, or PORT env var
+            reports_dir=Path(os.environ.get('REPORTS_DIR', 'reports')),
+            is_production=os.environ.get('FLASK_ENV') == 'production',
+            # The debugger and reloader are opt-in, so their file polling never runs by accident
+            debug=os.environ.get('FLASK_DEBUG', 'false').lower() in ('1', 'true')
+        )
+
+settings = Settings.from_env()
+
+@dataclass
+class AnalysisSummary:
+    """Result of a background analysis as sent to the client."""
+    session_id: str
+    candidate_name: str
+    target_role: str
+    overall_match: str
+    years_experience: int
+    leadership_experience: bool
+    architecture_experience: bool
+    technical_skills: list
+    implicit_skills: list
+    transferable_skills: list
+    market_demand: str
+    salary_range: str
+    report_path: str
+    key_findings: str
+    analysis_mode: str = 'Advanced AI (Local)'
+    job_availability: str = 'High demand in tech sector'
+    critical_gaps: list = field(default_factory=lambda: ['Machine Learning', 'Cloud Architecture'])
+    moderate_gaps: list = field(default_factory=lambda: ['DevOps', 'System Design'])
+    minor_gaps: list = field(default_factory=lambda: ['Testing Frameworks'])
+    recommendations: list = field(default_factory=lambda: [
+        'Complete a Machine Learning specialization course',
+        'Gain hands-on experience with AWS/Azure cloud platforms',
+        'Build portfolio projects demonstrating scalable architecture'
+    ])
+
+@functools.lru_cache(maxsize=1)
+def reports_dir() -> Path:
+    """Return the reports directory, creating it the first time it is needed."""
+    settings.reports_dir.mkdir(parents=True, exist_ok=True)
+    return settings.reports_dir
+
 # Initialize the Flask app
 app = Flask(__name__, 
            static_folder='frontend',
            template_folder='frontend')
 app.config['SECRET_KEY'] = 'a-secret-key-for-sessions'
 app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024  # Limit file size to 10MB
+# Static URLs carry a content hash (see versioned_static_urls), so browsers can keep assets for a year
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 365 * 24 * 3600
+# Compress JSON and HTML responses when flask-compress is installed. Report pages
+# carry their own pre-compressed bodies and file downloads stream as-is, so both are skipped.
+if Compress is not None:
+    app.config['COMPRESS_MIN_SIZE'] = 512
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    Compress(app)
+# Behind nginx I let the proxy stream report downloads itself via X-Accel-Redirect
+app.config['USE_X_ACCEL'] = os.getenv('USE_X_ACCEL', 'false').lower() == 'true'
 
-# Set up SocketIO for real-time updates
-socketio = SocketIO(app, cors_allowed_origins="*")
+class OrjsonSerializer:
+    """Drop-in for the json module when encoding Socket.IO packets, backed by orjson."""
+    
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # orjson output is always compact, so json's formatting arguments are ignored
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
 
-# These will keep track of the analysis jobs
-analysis_queue = queue.Queue()
-active_analyses = {}
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify responses skip the json module."""
+    
+    def dumps(self, obj, **kwargs):
+        # Types orjson doesn't know (Decimal, objects with __html__) go through Flask's converter
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+if orjson is not None:
+    app.json = OrjsonJSONProvider(app)
+
+# Set up SocketIO for real-time updates. Under eventlet or gevent all sockets
+# share one event loop instead of holding a thread each, and packets are
+# encoded with orjson when it is installed. With a message queue (Redis) several
+# server processes can emit to each other's clients.
+socketio_options = {'json': OrjsonSerializer} if orjson is not None else {}
+if os.getenv('SOCKETIO_MESSAGE_QUEUE'):
+    socketio_options['message_queue'] = os.getenv('SOCKETIO_MESSAGE_QUEUE')
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=ASYNC_MODE, **socketio_options)
+
+# These will keep track of the analysis jobs. They live in SQLite or Redis
+# rather than process memory, so any worker can look a session up and
+# sessions survive a restart; reports stay on disk either way.
+session_store = SessionStore()
+
+# Analyses run on a fixed-size pool; at most twice that many may be
+# running or waiting before new requests are turned away
+ANALYSIS_WORKERS = int(os.getenv('ANALYSIS_WORKERS', 4))
+analysis_executor = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix='analysis')
+analysis_slots = threading.BoundedSemaphore(ANALYSIS_WORKERS * 2)
+# Analyses holding a slot, used to tell clients where they are in the queue
+analyses_in_flight = 0
+analyses_in_flight_lock = threading.Lock()
+
+# CV parsing and the agent workflow are CPU-bound, so each pool thread hands
+# them to a worker process instead of competing for the server's GIL.
+# Workers are spawned rather than forked so they don't inherit the session
+# store's SQLite handle, held locks or the event loop of eventlet/gevent. The
+# pool starts on first use (or at preload below) and is replaced if it breaks.
+ANALYSIS_PROCESSES = int(os.getenv('ANALYSIS_PROCESSES', os.cpu_count() or 1))
+analysis_pool: Optional[ProcessPoolExecutor] = None
+analysis_pool_lock = threading.Lock()
+
+def analysis_processes() -> ProcessPoolExecutor:
+    """Return the worker process pool, starting it if there is none."""
+    global analysis_pool
+    with analysis_pool_lock:
+        if analysis_pool is None:
+            analysis_pool = ProcessPoolExecutor(max_workers=ANALYSIS_PROCESSES,
+                                                mp_context=multiprocessing.get_context('spawn'),
+                                                initializer=init_worker,
+                                                initargs=(logging.getLogger().level,))
+        return analysis_pool
+
+def discard_analysis_processes(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next submission starts a fresh one."""
+    global analysis_pool
+    with analysis_pool_lock:
+        # Another thread may already have replaced it
+        if analysis_pool is pool:
+            analysis_pool = None
+
+def submit_to_workers(fn, *args):
+    """Submit work to the process pool, replacing the pool if a worker has died."""
+    pool = analysis_processes()
+    try:
+        future = pool.submit(fn, *args)
+    except BrokenProcessPool:
+        logger.warning("Analysis worker pool is broken; starting a new one.")
+        discard_analysis_processes(pool)
+        pool = analysis_processes()
+        future = pool.submit(fn, *args)
+    
+    def discard_if_broken(done):
+        # A worker killed mid-task breaks the whole pool, so later work needs a new one
+        if not done.cancelled() and isinstance(done.exception(), BrokenProcessPool):
+            discard_analysis_processes(pool)
+    
+    future.add_done_callback(discard_if_broken)
+    return future
+
+def preload_analysis_processes() -> None:
+    """Start and warm up every worker process so the first analysis doesn't wait for them."""
+    pool = analysis_processes()
+    for _ in range(ANALYSIS_PROCESSES):
+        pool.submit(int)
+
+# Spawned workers (and the progress manager) re-import the main module when the
+# server is started with "python app.py", so only the server process itself
+# starts workers and background threads
+IS_SERVER_PROCESS = multiprocessing.parent_process() is None
+
+if IS_SERVER_PROCESS and os.getenv('PRELOAD_WORKERS', 'true').lower() == 'true':
+    preload_analysis_processes()
+
+# Cache of finished analyses so repeated uploads skip the agent pipeline
+analysis_cache = AnalysisCache()
+
+# Text extracted from recent uploads, keyed by a hash of the file, so a
+# re-uploaded CV skips PDF/DOCX extraction
+cv_text_cache = LRUCache(maxsize=int(os.getenv('CV_TEXT_CACHE_SIZE', 128)))
+cv_text_cache_lock = threading.Lock()
 
 # Define the file types the app will accept
 ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt'}
+ALLOWED_FILE_RE = re.compile(r'\.(?:%s)\Z' % '|'.join(sorted(ALLOWED_EXTENSIONS)), re.IGNORECASE)
+
+# Line that opens the report summary, and the heading that closes it
+KEY_FINDINGS_RE = re.compile(r'^.*?(?:executive summary|key findings).*$', re.IGNORECASE | re.MULTILINE)
+SECTION_END_RE = re.compile(r'^##(?!.*?(?:executive summary|key findings))', re.IGNORECASE | re.MULTILINE)
+
+# Rendered report pages kept in memory, keyed by report path and version
+REPORT_CACHE_SIZE = int(os.getenv('REPORT_CACHE_SIZE', 128))
+# How long browsers may keep a finished report without asking again
+REPORT_MAX_AGE = 365 * 24 * 3600
+
+# A candidate name is a line of at most four words without digits
+NAME_LINE_RE = re.compile(r'\s*((?:[^\s\d]+\s+){0,3}[^\s\d]+)\s*')
+NAME_EXCLUDE_RE = re.compile(r'email|phone|address|cv|resume', re.IGNORECASE)
+
+# Loggers streamed to the client during an analysis, and their format
+WS_LOG_PREFIXES = ('src.orchestrator', 'src.agents', __name__)
+WS_LOG_FORMATTER = logging.Formatter('%(name)s - %(message)s')
+
+# Real-time updates are sent in batches to cut down on socket writes
+BATCH_INTERVAL = 0.05
+BATCH_MAX_EVENTS = 64
+# Log records waiting for one session's next batch; more than this are dropped
+LOG_BUFFER_SIZE = 2048
+# How often a pool thread checks its worker process for progress events
+EVENT_POLL_INTERVAL = 0.1
+# Seconds before reassuring the user that a long analysis is still running
+WARNING_DELAY = 45.0
+
+# Agents in pipeline order, with the progress shown when each one starts
+AGENT_PROGRESS = {
+    'cv_parser': ('CV Parser', 25),
+    'skill_analyst': ('Skill Analyst', 50),
+    'market_intelligence': ('Market Intelligence', 75),
+    'report_generator': ('Report Generator', 90)
+}
+
+# Uploads are copied to disk 1MB at a time
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Greeting sent to every Socket.IO client; built once since reconnects are frequent
+CONNECTED_MESSAGE = {'message': 'Connected to analysis server'}
+
+# Routes that accept a CV upload
+UPLOAD_ENDPOINTS = frozenset({'analyze_cv_simple', 'analyze_cv', 'analyze_cv_stream'})
+
+# Form fields read from a multipart analysis request
+ANALYSIS_FORM_FIELDS = ('role', 'use_rag', 'verbose', 'model', 'api_source', 'extraction_method', 'analysis_mode')
+
+# All uploads share one directory; files left behind by crashed jobs are swept hourly
+UPLOAD_DIR = Path(tempfile.gettempdir()) / 'cv_uploads'
+UPLOAD_DIR.mkdir(exist_ok=True)
+UPLOAD_MAX_AGE = 3600
+
+# Values that show an API key was never filled in
+PLACEHOLDER_KEYS = frozenset({
+    'your_api_key_here', 'sk-...', 'api_key', 'key', 'secret', 'token',
+    'none', 'null', 'undefined', 'sk-your-openai-key-here',
+    'your-openai-key-here', 'your-anthropic-key-here', 'your-rapidapi-key-here'
+})
+# Short "sk-" keys, "sk-...your..." and "your-...key" style placeholders
+PLACEHOLDER_KEY_RE = re.compile(r'^sk-.{0,16}$|^sk-.*your|your-.*key|key.*your-', re.DOTALL)
+
+# Session IDs as issued by start_background_analysis (older reports end in a counter
+# instead of a hex suffix); anything else never reaches the filesystem
+SESSION_ID_RE = re.compile(r'analysis_\d{8}_\d{6}_(?:[0-9a-f]{8}|\d+)')
 
 def allowed_file(filename):
     """Check if file extension is allowed."""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return ALLOWED_FILE_RE.search(filename) is not None
 
+@functools.lru_cache(maxsize=16)
 def is_valid_api_key(key_value):
     """Check if API key is valid (not empty, not placeholder, has reasonable length)"""
     if not key_value:
         return False
     
-    key_lower = key_value.lower().strip()
+    key_lower = key_value.strip().lower()
     
-    # Check for common placeholder values
-    placeholder_values = [
-        'your_api_key_here', 'sk-...', 'api_key', 'key', 'secret', 'token', 
-        'none', 'null', 'undefined', 'sk-your-openai-key-here',
-        'your-openai-key-here', 'your-anthropic-key-here', 'your-rapidapi-key-here'
-    ]
-    if key_lower in placeholder_values:
+    # Check minimum length (most API keys are at least 20 characters)
+    if len(key_lower) < 10:
         return False
     
-    # Check for patterns that indicate placeholder values
-    if 'your-' in key_lower and 'key' in key_lower:
-        return False
-    if key_lower.startswith('sk-') and 'your' in key_lower:
-        return False
-    if key_lower.startswith('sk-') and len(key_lower) < 20:
-        return False
+    # Check for common placeholder values and patterns that indicate them
+    return key_lower not in PLACEHOLDER_KEYS and not PLACEHOLDER_KEY_RE.search(key_lower)
+
+@functools.lru_cache(maxsize=None)
+def get_api_key(name):
+    """Read an API key from the environment once per process."""
+    return os.getenv(name)
+
+@functools.lru_cache(maxsize=1)
+def status_features():
+    """Enabled features and external API availability, computed once per process."""
+    # Callers only read this; it is shared by every /api/status response
+    return {
+        'rag_enabled': os.getenv('USE_RAG', 'false').lower() == 'true',
+        'llm_enabled': os.getenv('USE_LLM_ANALYST', 'false').lower() == 'true',
+        'anthropic_available': is_valid_api_key(get_api_key('ANTHROPIC_API_KEY')),
+        'openai_available': is_valid_api_key(get_api_key('OPENAI_API_KEY')),
+        'rapidapi_available': is_valid_api_key(get_api_key('RAPIDAPI_KEY')),
+        'linkedin_available': is_valid_api_key(get_api_key('LINKEDIN_API_KEY'))
+    }
+
+def reload_api_keys(signum=None, frame=None):
+    """Forget cached API keys so rotated keys are picked up (bound to SIGHUP)."""
+    load_dotenv(override=True)
+    get_api_key.cache_clear()
+    is_valid_api_key.cache_clear()
+    status_features.cache_clear()
+    logger.info("API key cache cleared")
+
+if hasattr(signal, 'SIGHUP'):
+    try:
+        signal.signal(signal.SIGHUP, reload_api_keys)
+    except ValueError:
+        # Signal handlers can only be installed from the main thread
+        pass
+
+class EmitBatcher:
+    """
+    Coalesces analysis_update events for one session into batches.
+    Queued events are sent as a single analysis_update_batch message by the
+    shared flusher every BATCH_INTERVAL seconds, or as soon as
+    BATCH_MAX_EVENTS are waiting. Log records are queued raw and only
+    formatted by the flusher, so logging threads never wait on the socket.
+    """
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self._events = deque()
+        self._log_count = 0
+        self._lock = threading.Lock()
     
-    # Check minimum length (most API keys are at least 20 characters)
-    if len(key_value.strip()) < 10:
-        return False
-    return True
+    def push(self, payload):
+        """Queue an event for the next batch."""
+        with self._lock:
+            self._events.append(payload)
+            flush_now = len(self._events) >= BATCH_MAX_EVENTS
+        if flush_now:
+            self.flush()
+        else:
+            with pending_batchers_lock:
+                pending_batchers.add(self)
+    
+    def push_log(self, record):
+        """Queue a log record for the next batch, dropping it if the buffer is full."""
+        with self._lock:
+            if self._log_count >= LOG_BUFFER_SIZE:
+                return
+            self._log_count += 1
+            self._events.append(record)
+        with pending_batchers_lock:
+            pending_batchers.add(self)
+    
+    def flush(self):
+        """Send all queued events in one message."""
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+            self._log_count = 0
+        if events:
+            events = [log_entry(event) if isinstance(event, logging.LogRecord) else event
+                      for event in events]
+            socketio.emit('analysis_update_batch', events, room=self.session_id)
+
+def log_entry(record):
+    """Turn a log record into the update the client displays."""
+    try:
+        message = WS_LOG_FORMATTER.format(record)
+    except Exception:
+        # A bad format string shouldn't cost the client the rest of the batch
+        message = f"{record.name} - {record.msg}"
+    return {
+        'type': 'log',
+        'level': record.levelname,
+        'message': message,
+        'ts': record.created
+    }
+
+# Batchers with events waiting; one background task flushes them all, so
+# sessions don't each need their own timer thread
+pending_batchers = set()
+pending_batchers_lock = threading.Lock()
+
+def flush_pending_batches():
+    """Flush every session's queued events once per BATCH_INTERVAL."""
+    while True:
+        socketio.sleep(BATCH_INTERVAL)
+        with pending_batchers_lock:
+            batchers = list(pending_batchers)
+            pending_batchers.clear()
+        for batcher in batchers:
+            try:
+                batcher.flush()
+            except Exception as e:
+                logger.debug(f"Failed to flush updates for {batcher.session_id}: {e}")
+
+if IS_SERVER_PROCESS:
+    socketio.start_background_task(flush_pending_batches)
 
 class WebSocketLogHandler(logging.Handler):
     # This is a custom logging handler I wrote to push logs out through SocketIO.
     # It lets me stream backend logs directly to the frontend.
-    def __init__(self, session_id):
-        super().__init__()
-        self.session_id = session_id
+    def __init__(self, batcher):
+        super().__init__(logging.INFO)
+        self.batcher = batcher
+    
+    def filter(self, record):
+        # Only the pipeline's own loggers are streamed to the client
+        return record.name.startswith(WS_LOG_PREFIXES) and super().filter(record)
     
     def emit(self, record):
-        # This method is called by the logging system. It takes a log record,
-        # formats it, and sends it to the client in a specific session room.
+        # This method is called by the logging system. It just queues the record
+        # for the client in a specific session room; the flusher formats it later.
         try:
-            log_entry = {
-                'type': 'log',
-                'level': record.levelname,
-                'message': self.format(record),
-                'timestamp': datetime.now().isoformat()
-            }
-            socketio.emit('analysis_update', log_entry, room=self.session_id)
+            self.batcher.push_log(record)
         except Exception:
             # If something goes wrong with the WebSocket, I don't want to crash the whole analysis.
             pass
 
+@contextmanager
+def websocket_logging(batcher):
+    """Stream pipeline log records to a session's client while the block runs."""
+    handler = WebSocketLogHandler(batcher)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    try:
+        yield handler
+    finally:
+        root_logger.removeHandler(handler)
+
+@app.before_request
+def reject_oversized_uploads():
+    """Turn away uploads whose declared size is over the limit before any of the body is read."""
+    if request.endpoint not in UPLOAD_ENDPOINTS:
+        return None
+    if request.content_length is None:
+        # The raw-body route counts bytes as they arrive; multipart bodies need a size up front
+        if request.endpoint == 'analyze_cv_stream':
+            return None
+        return reject_unread_upload({'error': 'Content-Length required'}, 411)
+    if request.content_length > app.config['MAX_CONTENT_LENGTH']:
+        return reject_unread_upload({'error': 'File too large'}, 413)
+    return None
+
+def reject_unread_upload(body: Dict[str, Any], status: int):
+    """Error response for an upload whose body was never read."""
+    response = jsonify(body)
+    response.status_code = status
+    # The unread body is still on the socket, so the connection can't be reused
+    response.headers['Connection'] = 'close'
+    return response
+
+@functools.lru_cache(maxsize=None)
+def static_version(filename: str, mtime_ns: int) -> str:
+    """Short content hash of a frontend asset, computed once per version of the file."""
+    with open(os.path.join(app.static_folder, filename), 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=6).hexdigest()
+
+@app.url_defaults
+def versioned_static_urls(endpoint, values):
+    """Add the asset's content hash to static URLs so a deploy busts the browser cache."""
+    if endpoint != 'static' or 'v' in values or 'filename' not in values:
+        return
+    filename = values['filename']
+    try:
+        values['v'] = static_version(filename, os.stat(os.path.join(app.static_folder, filename)).st_mtime_ns)
+    except OSError:
+        pass
+
 @app.route('/')
 def index():
     """Serve the main application page."""
-    return render_template('index.html')
+    # The page links the current asset versions, so browsers must revalidate it
+    response = make_response(render_template('index.html'))
+    response.cache_control.no_cache = True
+    response.cache_control.must_revalidate = True
+    return response
 
 @app.route('/api/status')
 def api_status():
     """Check API health status."""
     try:
-        # Check if we can import our analysis modules
-        from src.orchestrator.workflow import CVAnalysisWorkflow
-        
-        # Check API key availability with proper validation
-        
-        anthropic_key = os.getenv('ANTHROPIC_API_KEY')
-        openai_key = os.getenv('OPENAI_API_KEY')
-        rapidapi_key = os.getenv('RAPIDAPI_KEY')
-        linkedin_key = os.getenv('LINKEDIN_API_KEY')
+        # Check that our analysis modules imported at startup
+        if WORKFLOW_IMPORT_ERROR:
+            raise ImportError(WORKFLOW_IMPORT_ERROR)
         
         return jsonify({
             'healthy': True,
             'timestamp': datetime.now().isoformat(),
             'version': '1.0.0',
-            'features': {
-                'rag_enabled': os.getenv('USE_RAG', 'false').lower() == 'true',
-                'llm_enabled': os.getenv('USE_LLM_ANALYST', 'false').lower() == 'true',
-                'anthropic_available': is_valid_api_key(anthropic_key),
-                'openai_available': is_valid_api_key(openai_key),
-                'rapidapi_available': is_valid_api_key(rapidapi_key),
-                'linkedin_available': is_valid_api_key(linkedin_key)
-            }
+            'features': status_features()
         })
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
@@ -164,30 +608,39 @@ def analyze_cv_simple():
         # Get target role
         target_role = request.form.get('target_role', 'Software Engineer')
         
-        # Save uploaded file temporarily
+        # Save uploaded file temporarily under a unique name, so concurrent
+        # uploads of the same file can't overwrite or delete each other
         filename = secure_filename(file.filename)
-        temp_path = os.path.join(tempfile.gettempdir(), filename)
+        temp_path = upload_path(filename)
         file.save(temp_path)
         
         try:
             # Load CV content
-            cv_content = load_cv_file(temp_path)
+            cv_content = load_cv_cached(temp_path)
             logger.info(f"Loaded CV content: {len(cv_content)} characters")
             
-            # Run analysis
-            logger.info("Starting CV analysis...")
-            result = run_analysis(cv_content, target_role)
+            # Run analysis (or reuse a cached result for the same CV and role)
+            key = cache_key(cv_content, target_role)
+            result = analysis_cache.get(key, cv_content, target_role)
+            if result is None:
+                logger.info("Starting CV analysis...")
+                result = run_analysis(cv_content, target_role)
+                analysis_cache.set(key, result, cv_content, target_role)
             
             # Prepare response
+            skills = result.skills_analysis
+            explicit = skills.explicit_skills if skills else None
+            seniority = skills.seniority_indicators if skills else None
+            insights = result.market_intelligence.market_insights if result.market_intelligence else None
             response_data = {
                 'success': True,
                 'candidate': result.cv_structured.personal.name if result.cv_structured else 'Unknown',
                 'target_role': target_role,
-            'technical_skills': len(result.skills_analysis.explicit_skills.get('tech', [])) if result.skills_analysis and result.skills_analysis.explicit_skills else 0,
-            'implicit_skills': len(result.skills_analysis.implicit_skills) if result.skills_analysis and result.skills_analysis.implicit_skills else 0,
-            'years_experience': result.skills_analysis.seniority_indicators.years_exp if result.skills_analysis and result.skills_analysis.seniority_indicators else 0,
-            'market_demand': result.market_intelligence.market_insights.demand_level if result.market_intelligence and result.market_intelligence.market_insights else 'Unknown',
-            'salary_range': f"${result.market_intelligence.market_insights.salary_range.min:,} - ${result.market_intelligence.market_insights.salary_range.max:,}" if result.market_intelligence and result.market_intelligence.market_insights and hasattr(result.market_intelligence.market_insights.salary_range, 'min') else 'Unknown',
+                'technical_skills': len(explicit.get('tech', [])) if explicit else 0,
+                'implicit_skills': len(skills.implicit_skills) if skills and skills.implicit_skills else 0,
+                'years_experience': seniority.years_exp if seniority else 0,
+                'market_demand': insights.demand_level if insights else 'Unknown',
+                'salary_range': insights.salary_range if insights and insights.salary_range else 'Unknown',
                 'report': result.final_report,
                 'errors': result.errors
             }
@@ -196,9 +649,8 @@ def analyze_cv_simple():
             return jsonify(response_data)
             
         finally:
-            # Clean up temporary file
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+            # Clean up temporary file; the upload reaper catches it if this never runs
+            cleanup_upload(temp_path)
     
     except Exception as e:
         logger.error(f"Analysis failed: {str(e)}")
@@ -207,497 +659,693 @@ def analyze_cv_simple():
 @app.route('/api/analyze', methods=['POST'])
 def analyze_cv():
     """Handle CV analysis request."""
+    file_path = None
     try:
-        # Validate request
-        if 'file' not in request.files:
-            return jsonify({'error': 'No file provided'}), 400
-        
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({'error': 'No file selected'}), 400
+        file_path, raw_filename, form = save_multipart_upload()
         
-        if not allowed_file(file.filename):
-            return jsonify({'error': 'File type not allowed'}), 400
-        
-        # Get form data
-        target_role = request.form.get('role', '').strip()
-        use_rag = request.form.get('use_rag', 'false').lower() == 'true'
-        verbose = request.form.get('verbose', 'false').lower() == 'true'
-        
-        # Get configuration from frontend
-        model = request.form.get('model', 'ollama')
-        api_source = request.form.get('api_source', 'static')
-        extraction_method = request.form.get('extraction_method', 'regex_ner')
-        analysis_mode = request.form.get('analysis_mode', 'standard')
+        # Validate request
+        if not raw_filename:
+            error = 'No file provided'
+        elif not allowed_file(raw_filename):
+            error = 'File type not allowed'
+        elif not form.get('role', '').strip():
+            error = 'Target role is required'
+        else:
+            error = None
+        if error:
+            cleanup_upload(file_path)
+            return jsonify({'error': error}), 400
         
-        if not target_role:
-            return jsonify({'error': 'Target role is required'}), 400
+        # Give the saved file its real name, which load_cv_file needs for the extension
+        filename = secure_filename(raw_filename)
+        final_path = upload_path(filename)
+        os.replace(file_path, final_path)
         
-        # Generate session ID for this analysis
-        session_id = f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(active_analyses)}"
+        return start_background_analysis(final_path, filename, form)
         
-        # Save uploaded file temporarily
-        filename = secure_filename(file.filename)
-        temp_dir = tempfile.mkdtemp()
-        file_path = os.path.join(temp_dir, filename)
+    except RequestEntityTooLarge:
+        cleanup_upload(file_path)
+        return jsonify({'error': 'File too large'}), 413
+    except Exception as e:
+        cleanup_upload(file_path)
+        logger.error(f"Analysis request failed: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def save_multipart_upload():
+    """
+    Save the 'file' part of a multipart upload to the upload directory.
+    Returns the saved path (None without a file part), the client's filename
+    and the form fields.
+    """
+    if StreamingFormDataParser is None:
+        # Werkzeug's form parser spools the whole body before we get to it
+        file = request.files.get('file')
+        if file is None or not file.filename:
+            return None, '', request.form
+        file_path = upload_path('upload')
         file.save(file_path)
+        return file_path, file.filename, request.form
+    
+    # Parse the body as it arrives, writing the file part straight to disk
+    file_path = upload_path('upload')
+    file_target = FileTarget(file_path)
+    field_targets = {name: ValueTarget() for name in ANALYSIS_FORM_FIELDS}
+    parser = StreamingFormDataParser(headers=request.headers)
+    parser.register('file', file_target)
+    for name, target in field_targets.items():
+        parser.register(name, target)
+    while chunk := request.stream.read(UPLOAD_CHUNK_SIZE):
+        parser.data_received(chunk)
+    
+    # Fields that weren't sent fall back to their defaults later
+    form = {name: target.value.decode('utf-8') for name, target in field_targets.items() if target.value}
+    if not os.path.exists(file_path):
+        return None, '', form
+    return file_path, file_target.multipart_filename or '', form
+
+@app.route('/api/analyze/stream', methods=['POST'])
+def analyze_cv_stream():
+    """
+    Handle CV analysis request with the raw file as the request body.
+    Filename comes from the X-Filename header and the configuration from the
+    query string, so the upload is written straight to disk without going
+    through multipart form parsing.
+    """
+    try:
+        raw_filename = unquote(request.headers.get('X-Filename', ''))
+        if not raw_filename:
+            return jsonify({'error': 'No file provided'}), 400
         
-        # Store analysis info
-        analysis_info = {
-            'session_id': session_id,
-            'file_path': file_path,
-            'filename': filename,
-            'target_role': target_role,
-            'use_rag': use_rag,
-            'verbose': verbose,
-            'model': model,
-            'api_source': api_source,
-            'extraction_method': extraction_method,
-            'analysis_mode': analysis_mode,
-            'status': 'queued',
-            'start_time': datetime.now().isoformat()
-        }
+        if not allowed_file(raw_filename):
+            return jsonify({'error': 'File type not allowed'}), 400
         
-        active_analyses[session_id] = analysis_info
+        params = request.args.to_dict()
+        if 'X-Target-Role' in request.headers:
+            params['role'] = unquote(request.headers['X-Target-Role'])
+        if not params.get('role', '').strip():
+            return jsonify({'error': 'Target role is required'}), 400
         
-        # Start analysis in background thread
-        thread = threading.Thread(
-            target=run_analysis_background,
-            args=(session_id, analysis_info)
-        )
-        thread.daemon = True
-        thread.start()
+        # Stream the request body to a temporary file
+        filename = secure_filename(raw_filename)
+        file_path = upload_path(filename)
+        stream_upload(file_path)
         
-        return jsonify({
-            'session_id': session_id,
-            'status': 'started',
-            'message': 'Analysis started successfully'
-        })
+        return start_background_analysis(file_path, filename, params)
         
+    except RequestEntityTooLarge:
+        return jsonify({'error': 'File too large'}), 413
     except Exception as e:
         logger.error(f"Analysis request failed: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
-def run_analysis_background(session_id: str, analysis_info: Dict[str, Any]):
-    """Run CV analysis in background thread."""
+def upload_path(filename: str) -> str:
+    """Return a unique path in the shared upload directory for an uploaded file."""
+    return str(UPLOAD_DIR / f"{uuid.uuid4().hex}_{filename}")
+
+def stream_upload(file_path: str) -> None:
+    """Copy the raw request body to disk in fixed-size chunks."""
+    max_size = app.config['MAX_CONTENT_LENGTH']
+    written = 0
     try:
-        # Update status
-        active_analyses[session_id]['status'] = 'running'
-        
-        # Set up WebSocket logging
-        log_handler = WebSocketLogHandler(session_id)
-        log_handler.setLevel(logging.INFO)
-        formatter = logging.Formatter('%(name)s - %(message)s')
-        log_handler.setFormatter(formatter)
-        
-        # Add handler to loggers
-        loggers_to_monitor = [
-            'src.orchestrator.workflow',
-            'src.agents.cv_parser', 
-            'src.agents.skill_analyst',
-            'src.agents.market_intelligence',
-            'src.agents.report_generator',
-            '__main__'
-        ]
-        
-        for logger_name in loggers_to_monitor:
-            logger_obj = logging.getLogger(logger_name)
-            logger_obj.addHandler(log_handler)
-            logger_obj.setLevel(logging.INFO)
-        
-        # Send initial progress
-        socketio.emit('analysis_update', {
-            'type': 'progress',
-            'percent': 0,
-            'message': 'Starting analysis...',
-            'stage': 'initialization'
-        }, room=session_id)
-        
-        # Set environment variables based on frontend configuration
-        model = analysis_info.get('model', 'ollama')
-        api_source = analysis_info.get('api_source', 'static')
-        extraction_method = analysis_info.get('extraction_method', 'regex_ner')
-        analysis_mode = analysis_info.get('analysis_mode', 'standard')
-        
-        # Check if we have valid API keys for the selected model
-        anthropic_key = os.getenv('ANTHROPIC_API_KEY')
-        openai_key = os.getenv('OPENAI_API_KEY')
-        rapidapi_key = os.getenv('RAPIDAPI_KEY')
-        
-        # Override model selection if API key is not available
-        if model == 'anthropic' and not is_valid_api_key(anthropic_key):
-            logger.warning("Anthropic API key not available, falling back to Ollama")
-            model = 'ollama'
-        elif model == 'openai' and not is_valid_api_key(openai_key):
-            logger.warning("OpenAI API key not available, falling back to Ollama")
-            model = 'ollama'
-        elif api_source == 'rag' and not is_valid_api_key(rapidapi_key):
-            logger.warning("RapidAPI key not available, falling back to static data")
-            api_source = 'static'
-        
-        # Set environment variables based on configuration
-        os.environ['USE_RAG'] = 'true' if api_source == 'rag' else 'false'
-        os.environ['USE_SPACY_PARSER'] = 'true' if extraction_method == 'spacy' else 'false'
-        os.environ['USE_LLM_ANALYST'] = 'true' if model in ['ollama', 'anthropic', 'openai'] else 'false'
-        os.environ['USE_LLM_REPORT'] = 'true' if model in ['ollama', 'anthropic', 'openai'] else 'false'
-        
-        logger.info(f"Configuration:")
-        logger.info(f"  - Model: {model}")
-        logger.info(f"  - API Source: {api_source}")
-        logger.info(f"  - Extraction: {extraction_method}")
-        logger.info(f"  - Analysis Mode: {analysis_mode}")
-        logger.info(f"  - RAG enabled: {os.environ['USE_RAG']}")
-        logger.info(f"  - spaCy Parser: {os.environ['USE_SPACY_PARSER']}")
-        logger.info(f"  - LLM Analyst: {os.environ['USE_LLM_ANALYST']}")
-        logger.info(f"  - LLM Report: {os.environ['USE_LLM_REPORT']}")
-        
-        # Force simple mode and INFO logging
-        os.environ['USE_SIMPLE_MODE'] = 'true'
-        os.environ['LOG_LEVEL'] = 'INFO'
-        logger.info("Using optimized settings for performance.")
-        
-        logger.info(f"API Key Status:")
-        logger.info(f"  - Anthropic: {'Available' if is_valid_api_key(anthropic_key) else 'Missing/Invalid'}")
-        logger.info(f"  - OpenAI: {'Available' if is_valid_api_key(openai_key) else 'Missing/Invalid'}")
-        logger.info(f"  - RapidAPI: {'Available' if is_valid_api_key(rapidapi_key) else 'Missing/Invalid'}")
-        
-        # Load CV content
-        logger.info(f"Loading CV file: {analysis_info['filename']}")
-        socketio.emit('analysis_update', {
-            'type': 'progress',
-            'percent': 10,
-            'message': 'Loading CV content...',
-            'stage': 'cv_parser'
-        }, room=session_id)
-        
-        cv_content = load_cv_file(analysis_info['file_path'])
-        logger.info(f"CV loaded. Content length: {len(cv_content)} characters.")
-        
-        # Run analysis pipeline
-        logger.info(f"Starting analysis for role: {analysis_info['target_role']}")
-        socketio.emit('analysis_update', {
-            'type': 'progress',
-            'percent': 20,
-            'message': f'Initializing analysis for {analysis_info["target_role"]}...',
-            'stage': 'workflow'
-        }, room=session_id)
-        
-        # Create output file path
-        output_dir = Path('reports')
-        output_dir.mkdir(exist_ok=True)
-        output_file = output_dir / f"report_{session_id}.md"
-        
-        # Run the analysis
-        logger.info("Executing LangGraph workflow...")
-        start_time = datetime.now()
+        with open(file_path, 'wb') as f:
+            while chunk := request.stream.read(UPLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > max_size:
+                    raise RequestEntityTooLarge()
+                f.write(chunk)
+    except BaseException:
+        # Don't leave a partial upload behind for the reaper
+        cleanup_upload(file_path)
+        raise
+
+def start_background_analysis(file_path: str, filename: str, params) -> Any:
+    """Register an uploaded CV and start analysing it in the background."""
+    # Get form data
+    target_role = params.get('role', '').strip()
+    use_rag = params.get('use_rag', 'false').lower() == 'true'
+    verbose = params.get('verbose', 'false').lower() == 'true'
+    
+    # Get configuration from frontend
+    model = params.get('model', 'ollama')
+    api_source = params.get('api_source', 'static')
+    extraction_method = params.get('extraction_method', 'regex_ner')
+    analysis_mode = params.get('analysis_mode', 'standard')
+    
+    # Refuse new work when the pool is saturated
+    if not analysis_slots.acquire(blocking=False):
+        cleanup_upload(file_path)
+        return jsonify({'error': 'Server busy, please try again shortly'}), 503
+    
+    # Everything past the running analyses is waiting ahead of this one
+    global analyses_in_flight
+    with analyses_in_flight_lock:
+        queue_position = max(0, analyses_in_flight - ANALYSIS_WORKERS + 1)
+        analyses_in_flight += 1
+    
+    # Generate session ID for this analysis
+    session_id = f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    
+    # Store analysis info
+    analysis_info = {
+        'session_id': session_id,
+        'file_path': file_path,
+        'filename': filename,
+        'target_role': target_role,
+        'use_rag': use_rag,
+        'verbose': verbose,
+        'model': model,
+        'api_source': api_source,
+        'extraction_method': extraction_method,
+        'analysis_mode': analysis_mode,
+        'status': 'queued',
+        'start_time': time.time()
+    }
+    
+    session_store.create(session_id, analysis_info)
+    
+    # Start analysis on the worker pool
+    future = analysis_executor.submit(run_analysis_background, session_id, analysis_info)
+    future.add_done_callback(release_analysis_slot)
+    
+    return jsonify({
+        'session_id': session_id,
+        'status': 'queued' if queue_position else 'started',
+        'queue_position': queue_position,
+        'message': 'Analysis queued' if queue_position else 'Analysis started successfully'
+    })
+
+def release_analysis_slot(_future) -> None:
+    """Free the pool slot held by a finished analysis."""
+    global analyses_in_flight
+    with analyses_in_flight_lock:
+        analyses_in_flight -= 1
+    analysis_slots.release()
+
+def load_cv_cached(file_path: str) -> str:
+    """Load CV text in a worker process, reusing the text of an identical earlier upload."""
+    with open(file_path, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    # The extension decides how the bytes are parsed, so it is part of the key
+    key = (digest, Path(file_path).suffix.lower())
+    with cv_text_cache_lock:
+        cv_content = cv_text_cache.get(key)
+    if cv_content is None:
+        cv_content = submit_to_workers(load_cv_file, file_path).result()
+        with cv_text_cache_lock:
+            cv_text_cache[key] = cv_content
+    return cv_content
+
+@functools.lru_cache(maxsize=1)
+def progress_manager():
+    """Start the manager process whose queues carry progress out of worker processes."""
+    return multiprocessing.get_context('spawn').Manager()
+
+def relay_workflow_events(future, events, on_agent_start, on_agent_end) -> None:
+    """Forward a worker process's agent and log events until its workflow finishes."""
+    while True:
+        try:
+            event = events.get(timeout=EVENT_POLL_INTERVAL)
+        except queue.Empty:
+            # The worker queues everything before returning, so done and empty means drained
+            if future.done():
+                return
+            continue
         
+        if isinstance(event, logging.LogRecord):
+            # Hand the record to our own handlers so it is printed and streamed like a local log
+            logging.getLogger(event.name).handle(event)
+        else:
+            kind, agent_id = event
+            if kind == 'agent_start':
+                on_agent_start(agent_id)
+            else:
+                on_agent_end(agent_id)
+
+def cleanup_upload(file_path: Optional[str]) -> None:
+    """Remove an uploaded file, if one was saved."""
+    if not file_path:
+        return
+    try:
+        Path(file_path).unlink(missing_ok=True)
+    except Exception:
+        pass
+
+def reap_stale_uploads() -> None:
+    """Periodically delete uploads older than UPLOAD_MAX_AGE and expired sessions."""
+    while True:
+        cutoff = time.time() - UPLOAD_MAX_AGE
+        for path in UPLOAD_DIR.iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+        try:
+            session_store.purge_expired()
+        except Exception as e:
+            logger.warning(f"Session sweep failed: {e}")
+        time.sleep(UPLOAD_MAX_AGE)
+
+if IS_SERVER_PROCESS:
+    threading.Thread(target=reap_stale_uploads, name='upload-reaper', daemon=True).start()
+
+def run_analysis_background(session_id: str, analysis_info: Dict[str, Any]):
+    """Run CV analysis on the worker pool."""
+    batcher = EmitBatcher(session_id)
+    warning_timer = None
+    with websocket_logging(batcher):
         try:
-            # Send progress update and show agent tracker
-            socketio.emit('analysis_update', {
+            # Update status
+            session_store.update(session_id, status='running')
+            
+            # Send initial progress
+            batcher.push({
+                'type': 'progress',
+                'percent': 0,
+                'message': 'Starting analysis...',
+                'stage': 'initialization'
+            })
+            
+            # Set environment variables based on frontend configuration
+            model = analysis_info.get('model', 'ollama')
+            api_source = analysis_info.get('api_source', 'static')
+            extraction_method = analysis_info.get('extraction_method', 'regex_ner')
+            analysis_mode = analysis_info.get('analysis_mode', 'standard')
+            
+            # Check if we have valid API keys for the selected model
+            anthropic_key = get_api_key('ANTHROPIC_API_KEY')
+            openai_key = get_api_key('OPENAI_API_KEY')
+            rapidapi_key = get_api_key('RAPIDAPI_KEY')
+            
+            # Override model selection if API key is not available
+            if model == 'anthropic' and not is_valid_api_key(anthropic_key):
+                logger.warning("Anthropic API key not available, falling back to Ollama")
+                model = 'ollama'
+            elif model == 'openai' and not is_valid_api_key(openai_key):
+                logger.warning("OpenAI API key not available, falling back to Ollama")
+                model = 'ollama'
+            elif api_source == 'rag' and not is_valid_api_key(rapidapi_key):
+                logger.warning("RapidAPI key not available, falling back to static data")
+                api_source = 'static'
+            
+            # Environment variables for the worker process, based on configuration
+            workflow_env = {
+                'USE_RAG': 'true' if api_source == 'rag' else 'false',
+                'USE_SPACY_PARSER': 'true' if extraction_method == 'spacy' else 'false',
+                'USE_LLM_ANALYST': 'true' if model in ['ollama', 'anthropic', 'openai'] else 'false',
+                'USE_LLM_REPORT': 'true' if model in ['ollama', 'anthropic', 'openai'] else 'false'
+            }
+            
+            # Force simple mode and INFO logging
+            workflow_env['USE_SIMPLE_MODE'] = 'true'
+            workflow_env['LOG_LEVEL'] = 'INFO'
+            
+            # One record each instead of a line per setting, since every record is also a socket event
+            logger.info("Configuration: model=%s, api_source=%s, extraction=%s, mode=%s",
+                        model, api_source, extraction_method, analysis_mode)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Workflow flags: rag=%s, spacy=%s, llm_analyst=%s, llm_report=%s; "
+                    "API keys: anthropic=%s, openai=%s, rapidapi=%s",
+                    workflow_env['USE_RAG'], workflow_env['USE_SPACY_PARSER'],
+                    workflow_env['USE_LLM_ANALYST'], workflow_env['USE_LLM_REPORT'],
+                    *('available' if is_valid_api_key(key) else 'missing'
+                      for key in (anthropic_key, openai_key, rapidapi_key))
+                )
+            
+            # Load CV content
+            logger.info(f"Loading CV file: {analysis_info['filename']}")
+            batcher.push({
                 'type': 'progress',
                 'percent': 10,
-                'message': 'Initializing multi-agent pipeline...',
+                'message': 'Loading CV content...',
+                'stage': 'cv_parser'
+            })
+            
+            cv_content = load_cv_cached(analysis_info['file_path'])
+            logger.info(f"CV loaded. Content length: {len(cv_content)} characters.")
+            
+            # Run analysis pipeline
+            logger.info(f"Starting analysis for role: {analysis_info['target_role']}")
+            batcher.push({
+                'type': 'progress',
+                'percent': 20,
+                'message': f'Initializing analysis for {analysis_info["target_role"]}...',
                 'stage': 'workflow'
-            }, room=session_id)
+            })
+            
+            # Create output file path
+            output_file = reports_dir() / f"report_{session_id}.md"
+            
+            # Reuse a previous result for the same CV, role and configuration. The
+            # workflow flags hold the resolved market data source and LLM switches,
+            # so they are part of the key alongside the provider
+            flags = ','.join(f"{name}={value}" for name, value in sorted(workflow_env.items()))
+            cache_model = f"web:{model}:{flags}"
+            key = cache_key(cv_content, analysis_info['target_role'], cache_model, extraction_method)
+            result = analysis_cache.get(key, cv_content, analysis_info['target_role'], cache_model,
+                                        extraction_method)
             
             # Show agent tracker
-            socketio.emit('analysis_update', {
+            batcher.push({
                 'type': 'show_agents',
                 'message': 'Agent pipeline activated'
-            }, room=session_id)
+            })
             
-            # Start CV Parser
-            socketio.emit('analysis_update', {
-                'type': 'agent_status',
-                'agent': 'cv_parser',
-                'status': 'Processing',
-                'status_class': 'active'
-            }, room=session_id)
+            # Run the analysis, timed with the monotonic clock so clock changes can't skew it
+            start_time = time.monotonic()
             
-            # Add timeout warning
-            def timeout_warning():
-                time.sleep(45)
-                socketio.emit('analysis_update', {
-                    'type': 'log',
-                    'level': 'INFO',
-                    'message': 'Analysis in progress... the multi-agent pipeline is working on your CV.',
-                    'timestamp': datetime.now().isoformat()
-                }, room=session_id)
+            try:
+                if result is not None:
+                    logger.info("Found cached analysis for this CV, skipping agent pipeline.")
+                    for agent_id in AGENT_PROGRESS:
+                        batcher.push({
+                            'type': 'agent_status',
+                            'agent': agent_id,
+                            'status': 'Completed',
+                            'status_class': 'completed'
+                        })
+                else:
+                    logger.info("Executing LangGraph workflow...")
+                    batcher.push({
+                        'type': 'progress',
+                        'percent': 10,
+                        'message': 'Initializing multi-agent pipeline...',
+                        'stage': 'workflow'
+                    })
+                    
+                    # Add timeout warning (cancelled below if the analysis finishes first)
+                    def timeout_warning():
+                        batcher.push({
+                            'type': 'log',
+                            'level': 'INFO',
+                            'message': 'Analysis in progress... the multi-agent pipeline is working on your CV.',
+                            'ts': time.time()
+                        })
+                    
+                    warning_timer = threading.Timer(WARNING_DELAY, timeout_warning)
+                    warning_timer.daemon = True
+                    warning_timer.start()
+                    
+                    # The agents report their own progress as the workflow reaches them
+                    def on_agent_start(agent_id):
+                        agent_name, progress = AGENT_PROGRESS[agent_id]
+                        batcher.push({
+                            'type': 'agent_status',
+                            'agent': agent_id,
+                            'status': 'Processing',
+                            'status_class': 'active'
+                        })
+                        batcher.push({
+                            'type': 'progress',
+                            'percent': progress,
+                            'message': f'{agent_name} analyzing...',
+                            'stage': agent_id
+                        })
+                    
+                    def on_agent_end(agent_id):
+                        batcher.push({
+                            'type': 'agent_status',
+                            'agent': agent_id,
+                            'status': 'Completed',
+                            'status_class': 'completed'
+                        })
+                    
+                    # Execute the workflow in a worker process, relaying its progress
+                    events = progress_manager().Queue()
+                    future = submit_to_workers(run_workflow, cv_content, analysis_info['target_role'],
+                                               workflow_env, events)
+                    relay_workflow_events(future, events, on_agent_start, on_agent_end)
+                    result = future.result()
+                    analysis_cache.set(key, result, cv_content, analysis_info['target_role'],
+                                       cache_model, extraction_method)
+                
+                duration = time.monotonic() - start_time
+                logger.info(f"Analysis completed in {duration:.2f} seconds.")
+                
+            except Exception as workflow_error:
+                logger.error(f"LangGraph workflow failed: {str(workflow_error)}")
+                batcher.push({
+                    'type': 'error',
+                    'message': f"Workflow execution failed: {str(workflow_error)}",
+                    'stage': 'workflow_error'
+                })
+                raise workflow_error
+            
+            # Log analysis results
+            if result.errors:
+                logger.warning(f"Analysis finished with {len(result.errors)} warnings.")
+                for error in result.errors:
+                    logger.warning(f"  - {error}")
+            else:
+                logger.info("Analysis finished successfully.")
+            
+            if result.skills_analysis and result.skills_analysis.explicit_skills:
+                tech_skills = result.skills_analysis.explicit_skills.get('tech', [])
+                logger.info(f"Found {len(tech_skills)} technical skills.")
             
-            warning_thread = threading.Thread(target=timeout_warning)
-            warning_thread.daemon = True
-            warning_thread.start()
+            if result.market_intelligence and result.market_intelligence.market_insights:
+                demand = result.market_intelligence.market_insights.demand_level
+                logger.info(f"Market demand level: {demand}")
+            
+            # Send final progress update
+            batcher.push({
+                'type': 'progress',
+                'percent': 100,
+                'message': 'Analysis complete!',
+                'stage': 'complete'
+            })
             
-            # Simulate agent progress updates
-            agents = [
-                ('cv_parser', 'CV Parser', 25),
-                ('skill_analyst', 'Skill Analyst', 50), 
-                ('market_intelligence', 'Market Intelligence', 75),
-                ('report_generator', 'Report Generator', 100)
-            ]
+            # Save report
+            report_content = result.final_report or "No report generated."
+            logger.info(f"Generated report with {len(report_content)} characters.")
             
-            for i, (agent_id, agent_name, progress) in enumerate(agents):
-                # Update previous agent to completed
-                if i > 0:
-                    prev_agent = agents[i-1][0]
-                    socketio.emit('analysis_update', {
-                        'type': 'agent_status',
-                        'agent': prev_agent,
-                        'status': 'Completed',
-                        'status_class': 'completed'
-                    }, room=session_id)
+            logger.info(f"Saving report to: {output_file}")
+            write_file_atomic(output_file, report_content)
+            logger.info("Report saved.")
+            
+            # Prepare comprehensive result data
+            skills = result.skills_analysis
+            explicit = skills.explicit_skills if skills else None
+            seniority = skills.seniority_indicators if skills else None
+            insights = result.market_intelligence.market_insights if result.market_intelligence else None
+            result_data = asdict(AnalysisSummary(
+                session_id=session_id,
+                candidate_name=extract_candidate_name(cv_content),
+                target_role=analysis_info['target_role'],
+                overall_match=core_skill_match(result),
                 
-                # Set current agent to active
-                socketio.emit('analysis_update', {
-                    'type': 'agent_status',
-                    'agent': agent_id,
-                    'status': 'Processing',
-                    'status_class': 'active'
-                }, room=session_id)
+                # Experience and seniority
+                years_experience=seniority.years_exp if seniority else 0,
+                leadership_experience=seniority.leadership if seniority else False,
+                architecture_experience=seniority.architecture if seniority else False,
                 
-                # Update progress
-                socketio.emit('analysis_update', {
-                    'type': 'progress',
-                    'percent': progress,
-                    'message': f'{agent_name} analyzing...',
-                    'stage': agent_id
-                }, room=session_id)
+                # Skills breakdown
+                technical_skills=explicit.get('tech', []) if explicit else [],
+                implicit_skills=list(map(attrgetter('skill'), skills.implicit_skills)) if skills and skills.implicit_skills else [],
+                transferable_skills=explicit.get('soft', []) if explicit else [],
                 
-                # Small delay to show progress
-                time.sleep(0.5)
-            
-            # Execute the workflow
-            result = run_analysis(cv_content, analysis_info['target_role'])
+                # Market intelligence
+                market_demand=insights.demand_level if insights and insights.demand_level else 'Medium',
+                salary_range=insights.salary_range if insights and insights.salary_range else 'Not available',
+                
+                # Report metadata
+                report_path=str(output_file),
+                key_findings=extract_key_findings(report_content)
+            ))
             
-            # Mark final agent as completed
-            socketio.emit('analysis_update', {
-                'type': 'agent_status',
-                'agent': 'report_generator',
-                'status': 'Completed',
-                'status_class': 'completed'
-            }, room=session_id)
+            # Log final results
+            logger.info(f"Finished analysis for {result_data['candidate_name']}.")
+            logger.info(f"Technical skills: {result_data['technical_skills']}")
+            logger.info(f"Implicit skills: {result_data['implicit_skills']}")
+            logger.info(f"Market demand: {result_data['market_demand']}")
             
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-            logger.info(f"Analysis completed in {duration:.2f} seconds.")
+            # Update analysis status first, so the report links in the result work right away.
+            # The result is kept too, for clients that join after it was sent (see handle_join_analysis)
+            session_store.update(
+                session_id,
+                status='completed',
+                report_path=result_data['report_path'],
+                result=result_data,
+                end_time=time.time()
+            )
             
-        except Exception as workflow_error:
-            logger.error(f"LangGraph workflow failed: {str(workflow_error)}")
-            socketio.emit('analysis_update', {
-                'type': 'error',
-                'message': f"Workflow execution failed: {str(workflow_error)}",
-                'stage': 'workflow_error'
-            }, room=session_id)
-            raise workflow_error
-        
-        # Log analysis results
-        if result.errors:
-            logger.warning(f"Analysis finished with {len(result.errors)} warnings.")
-            for error in result.errors:
-                logger.warning(f"  - {error}")
-        else:
-            logger.info("Analysis finished successfully.")
-        
-        if result.skills_analysis and result.skills_analysis.explicit_skills:
-            tech_skills = result.skills_analysis.explicit_skills.get('tech', [])
-            logger.info(f"Found {len(tech_skills)} technical skills.")
-        
-        if result.market_intelligence and result.market_intelligence.market_insights:
-            demand = result.market_intelligence.market_insights.demand_level
-            logger.info(f"Market demand level: {demand}")
-        
-        # Send final progress update
-        socketio.emit('analysis_update', {
-            'type': 'progress',
-            'percent': 100,
-            'message': 'Analysis complete!',
-            'stage': 'complete'
-        }, room=session_id)
-        
-        # Save report
-        report_content = result.final_report or "No report generated."
-        logger.info(f"Generated report with {len(report_content)} characters.")
-        
-        logger.info(f"Saving report to: {output_file}")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(report_content)
-        logger.info("Report saved.")
-        
-        # Prepare comprehensive result data
-        result_data = {
-            'session_id': session_id,
-            'candidate_name': extract_candidate_name(cv_content),
-            'target_role': analysis_info['target_role'],
-            'overall_match': '85%',  # Calculate based on analysis
-            'analysis_mode': 'Advanced AI (Local)',
+            # Send final results without waiting for the next batch tick
+            batcher.push({
+                'type': 'result',
+                'result': result_data
+            })
+            batcher.flush()
             
-            # Experience and seniority
-            'years_experience': result.skills_analysis.seniority_indicators.years_exp if result.skills_analysis and result.skills_analysis.seniority_indicators else 0,
-            'leadership_experience': result.skills_analysis.seniority_indicators.leadership if result.skills_analysis and result.skills_analysis.seniority_indicators else False,
-            'architecture_experience': result.skills_analysis.seniority_indicators.architecture if result.skills_analysis and result.skills_analysis.seniority_indicators else False,
+            logger.info(f"Session {session_id} completed.")
             
-            # Skills breakdown
-            'technical_skills': result.skills_analysis.explicit_skills.get('tech', []) if result.skills_analysis.explicit_skills else [],
-            'implicit_skills': [skill.skill for skill in result.skills_analysis.implicit_skills] if result.skills_analysis.implicit_skills else [],
-            'transferable_skills': result.skills_analysis.explicit_skills.get('soft', []) if result.skills_analysis.explicit_skills else [],
+        except Exception as e:
+            logger.error(f"Background analysis failed: {str(e)}")
+            logger.error(f"Error details: {type(e).__name__}: {str(e)}")
             
-            # Market intelligence
-            'market_demand': result.market_intelligence.market_insights.demand_level if result.market_intelligence and result.market_intelligence.market_insights else 'Medium',
-            'salary_range': '$80,000 - $120,000',  # Extract from market data
-            'job_availability': 'High demand in tech sector',
+            # Send error notification
+            batcher.push({
+                'type': 'error',
+                'message': f"Analysis failed: {str(e)}",
+                'error_type': type(e).__name__
+            })
             
-            # Gap analysis
-            'critical_gaps': ['Machine Learning', 'Cloud Architecture'],
-            'moderate_gaps': ['DevOps', 'System Design'],
-            'minor_gaps': ['Testing Frameworks'],
+            # Update status
+            session_store.update(
+                session_id,
+                status='failed',
+                error=str(e),
+                end_time=time.time()
+            )
+        
+        finally:
+            # A quick analysis shouldn't get the slow-progress notice afterwards
+            if warning_timer is not None:
+                warning_timer.cancel()
             
-            # Recommendations
-            'recommendations': [
-                'Complete a Machine Learning specialization course',
-                'Gain hands-on experience with AWS/Azure cloud platforms',
-                'Build portfolio projects demonstrating scalable architecture'
-            ],
+            # Deliver anything still buffered before the worker exits
+            batcher.flush()
             
-            # Report metadata
-            'report_size': f"{len(report_content):,} characters",
-            'report_path': str(output_file),
-            'key_findings': extract_key_findings(report_content)
-        }
-        
-        # Log final results
-        logger.info(f"Finished analysis for {result_data['candidate_name']}.")
-        logger.info(f"Technical skills: {result_data['technical_skills']}")
-        logger.info(f"Implicit skills: {result_data['implicit_skills']}")
-        logger.info(f"Market demand: {result_data['market_demand']}")
-        
-        # Send final results
-        socketio.emit('analysis_update', {
-            'type': 'result',
-            'result': result_data
-        }, room=session_id)
-        
-        # Update analysis status
-        active_analyses[session_id].update({
-            'status': 'completed',
-            'result': result_data,
-            'end_time': datetime.now().isoformat()
-        })
-        
-        logger.info(f"Session {session_id} completed.")
-        
-        # Clean up log handler
-        for logger_name in loggers_to_monitor:
-            logger_obj = logging.getLogger(logger_name)
-            logger_obj.removeHandler(log_handler)
-        
-    except Exception as e:
-        logger.error(f"Background analysis failed: {str(e)}")
-        logger.error(f"Error details: {type(e).__name__}: {str(e)}")
-        
-        # Send error notification
-        socketio.emit('analysis_update', {
-            'type': 'error',
-            'message': f"Analysis failed: {str(e)}",
-            'error_type': type(e).__name__
-        }, room=session_id)
-        
-        # Update status
-        active_analyses[session_id].update({
-            'status': 'failed',
-            'error': str(e),
-            'end_time': datetime.now().isoformat()
-        })
-    
-    finally:
-        # Clean up temporary file
-        try:
-            if os.path.exists(analysis_info['file_path']):
-                os.remove(analysis_info['file_path'])
-                os.rmdir(os.path.dirname(analysis_info['file_path']))
-        except Exception:
-            pass
+            # Clean up temporary file
+            cleanup_upload(analysis_info['file_path'])
+
+def write_file_atomic(path, content: str) -> None:
+    """Write a file and move it into place in one step, so readers never see it half-written."""
+    # Each writer gets its own temp file, so concurrent renders of one report can't interleave
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, path)
 
 def extract_candidate_name(cv_content: str) -> str:
     """Extract candidate name from CV content."""
-    lines = cv_content.split('\n')[:10]  # Check first 10 lines
-    for line in lines:
-        line = line.strip()
-        if line and len(line.split()) <= 4 and not any(char.isdigit() for char in line):
-            # Likely a name if it's short, no numbers, and not empty
-            if not any(keyword in line.lower() for keyword in ['email', 'phone', 'address', 'cv', 'resume']):
-                return line
+    # Likely a name if it's one of the first 10 lines, short, has no numbers and isn't a contact label
+    for line in cv_content.split('\n', 10)[:10]:
+        match = NAME_LINE_RE.fullmatch(line)
+        if match and not NAME_EXCLUDE_RE.search(line):
+            return match.group(1)
     return "Unknown Candidate"
 
+def core_skill_match(result) -> str:
+    """Share of the role's core skills found in the CV, as a percentage string."""
+    core_skills = result.market_intelligence.role_requirements.core_skills if result.market_intelligence else []
+    if not core_skills:
+        return 'N/A'
+    skills = result.skills_analysis
+    found = set()
+    if skills:
+        found.update(skill.lower() for skill in skills.explicit_skills.get('tech', []))
+        found.update(skill.skill.lower() for skill in skills.implicit_skills)
+    matched = sum(skill.lower() in found for skill in core_skills)
+    return f"{round(100 * matched / len(core_skills))}%"
+
 def extract_key_findings(report_content: str) -> str:
     """Extract key findings from the report."""
     if not report_content:
         return "Report generation completed successfully."
     
-    # Look for executive summary or key findings section
-    lines = report_content.split('\n')
-    in_summary = False
+    # Look for executive summary or key findings section, and only split
+    # the lines between it and the next "##" heading
     summary_lines = []
-    
-    for line in lines:
-        if 'executive summary' in line.lower() or 'key findings' in line.lower():
-            in_summary = True
-            continue
-        elif line.startswith('##') and in_summary:
-            break
-        elif in_summary and line.strip():
-            summary_lines.append(line.strip())
+    match = KEY_FINDINGS_RE.search(report_content)
+    if match:
+        end = SECTION_END_RE.search(report_content, match.end())
+        section = report_content[match.end():end.start() if end else len(report_content)]
+        summary_lines = [line.strip() for line in section.split('\n')
+                         if line.strip() and not KEY_FINDINGS_RE.match(line)]
     
     if summary_lines:
         return ' '.join(summary_lines[:3])  # First 3 lines
     else:
         return "Comprehensive skill gap analysis completed with personalized recommendations."
 
+def get_active_analysis(session_id: str):
+    """Look up a tracked analysis, or None if it is unknown or has expired."""
+    return session_store.get(session_id)
+
 @app.route('/api/report/<session_id>')
 def get_report(session_id):
     """Get analysis report for a session."""
-    # First check if session is in active analyses
-    if session_id in active_analyses:
-        analysis = active_analyses[session_id]
+    if not SESSION_ID_RE.fullmatch(session_id):
+        return jsonify({'error': 'Session not found'}), 404
+    
+    # First check the session store
+    analysis = get_active_analysis(session_id)
+    if analysis is not None:
         if analysis['status'] != 'completed':
             return jsonify({'error': 'Analysis not completed'}), 400
         
-        report_path = analysis['result']['report_path']
+        report_path = analysis['report_path']
         if not os.path.exists(report_path):
             return jsonify({'error': 'Report file not found'}), 404
         
-        return send_file(report_path, as_attachment=True, download_name=f"analysis_report_{session_id}.md")
+        return send_report_file(report_path, session_id)
     
-    # Fallback: Check if report file exists on disk (for cases where server was restarted)
-    logger.info(f"Session {session_id} not found in active analyses, checking for existing report file...")
+    # Fallback: Check if report file exists on disk (for sessions that were already swept)
+    logger.info(f"Session {session_id} not found in session store, checking for existing report file...")
     
     # Construct expected report file path
-    report_path = Path('reports') / f"report_{session_id}.md"
+    report_path = settings.reports_dir / f"report_{session_id}.md"
     
     if not report_path.exists():
         logger.warning(f"Report file not found: {report_path}")
         return jsonify({'error': 'Session not found and no report file exists'}), 404
     
     logger.info(f"Found existing report file: {report_path}")
-    return send_file(str(report_path), as_attachment=True, download_name=f"analysis_report_{session_id}.md")
+    return send_report_file(str(report_path), session_id)
+
+def send_report_file(report_path: str, session_id: str):
+    """Send a report download, handing the transfer to nginx when X-Accel is enabled."""
+    download_name = f"analysis_report_{session_id}.md"
+    if not app.config.get('USE_X_ACCEL'):
+        return cache_report_response(send_file(report_path, as_attachment=True, download_name=download_name))
+
+    # nginx maps this internal location onto the reports directory and sends the file itself
+    response = make_response('')
+    response.headers['X-Accel-Redirect'] = f"/_protected_reports/{os.path.basename(report_path)}"
+    response.headers['Content-Type'] = 'text/markdown'
+    response.headers['Content-Disposition'] = f"attachment; filename={download_name}"
+    return cache_report_response(response)
+
+def cache_report_response(response):
+    """Let the browser keep a finished report, which never changes once written."""
+    # Reports hold personal data, so shared caches and CDNs must not store them
+    response.cache_control.no_cache = None
+    response.cache_control.public = None
+    response.cache_control.private = True
+    response.cache_control.max_age = REPORT_MAX_AGE
+    response.cache_control.immutable = True
+    return response
 
 @app.route('/report/<session_id>')
 def view_report(session_id):
     """View report in browser."""
-    # First check if session is in active analyses
-    if session_id in active_analyses:
-        analysis = active_analyses[session_id]
+    if not SESSION_ID_RE.fullmatch(session_id):
+        return "<h1>Report Not Found</h1><p>The requested report was not found.</p>", 404
+    
+    # First check the session store
+    analysis = get_active_analysis(session_id)
+    if analysis is not None:
         if analysis['status'] != 'completed':
             return "<h1>Report Not Ready</h1><p>The analysis is still in progress. Please wait for completion.</p>", 400
         
-        report_path = analysis['result']['report_path']
+        report_path = analysis['report_path']
         if not os.path.exists(report_path):
             return "<h1>Report File Missing</h1><p>The report file could not be found.</p>", 404
     else:
-        # Fallback: Check if report file exists on disk (for cases where server was restarted)
-        logger.info(f"Session {session_id} not found in active analyses, checking for existing report file...")
+        # Fallback: Check if report file exists on disk (for sessions that were already swept)
+        logger.info(f"Session {session_id} not found in session store, checking for existing report file...")
         
         # Construct expected report file path
-        report_path = Path('reports') / f"report_{session_id}.md"
+        report_path = settings.reports_dir / f"report_{session_id}.md"
         
         if not report_path.exists():
             logger.warning(f"Report file not found: {report_path}")
@@ -706,293 +1354,101 @@ def view_report(session_id):
         logger.info(f"Found existing report file: {report_path}")
         report_path = str(report_path)
     
+    # The page only changes with the markdown, so browsers that already have
+    # this version get a 304 before anything is read or rendered
+    report_stat = os.stat(report_path)
+    encoding = preferred_report_encoding()
+    etag = f"{report_stat.st_mtime_ns:x}-{report_stat.st_size:x}-{encoding}"
+    if request.if_none_match.contains_weak(etag):
+        response = make_response('', 304)
+        response.set_etag(etag)
+        response.vary.add('Accept-Encoding')
+        return cache_report_response(response)
+    
+    # Reuse the rendered and compressed page unless the markdown changed since it was rendered
     try:
-        with open(report_path, 'r', encoding='utf-8') as f:
-            report_content = f.read()
-        
-        # Convert markdown to HTML for better display
-        import markdown
-        html_content = markdown.markdown(report_content, extensions=['tables', 'fenced_code'])
-        
-        return f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <title>AI Skill Gap Analysis Report</title>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1">
-            <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-            <style>
-                * {{
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                }}
-                
-                body {{
-                    font-family: 'Inter', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    line-height: 1.7;
-                    color: #2d3748;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    min-height: 100vh;
-                    padding: 20px;
-                }}
-                
-                .report-container {{
-                    background: white;
-                    border-radius: 16px;
-                    padding: 40px;
-                    box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    position: relative;
-                }}
-                
-                .report-header {{
-                    text-align: center;
-                    margin-bottom: 40px;
-                    padding-bottom: 30px;
-                    border-bottom: 3px solid #667eea;
-                }}
-                
-                .report-title {{
-                    font-size: 2.5rem;
-                    font-weight: 700;
-                    color: #2d3748;
-                    margin-bottom: 10px;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    gap: 15px;
-                }}
-                
-                .report-subtitle {{
-                    color: #718096;
-                    font-size: 1.1rem;
-                    font-weight: 500;
-                }}
-                
-                .back-button {{
-                    display: inline-flex;
-                    align-items: center;
-                    gap: 8px;
-                    margin-bottom: 30px;
-                    padding: 12px 24px;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    text-decoration: none;
-                    border-radius: 8px;
-                    font-weight: 600;
-                    transition: all 0.3s ease;
-                    box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-                }}
-                
-                .back-button:hover {{
-                    transform: translateY(-2px);
-                    box-shadow: 0 8px 25px rgba(102, 126, 234, 0.4);
-                    text-decoration: none;
-                    color: white;
-                }}
-                
-                h1 {{
-                    font-size: 2.2rem;
-                    color: #2d3748;
-                    margin: 40px 0 20px 0;
-                    padding-bottom: 15px;
-                    border-bottom: 2px solid #e2e8f0;
-                    position: relative;
-                }}
-                
-                h1::before {{
-                    content: '';
-                    position: absolute;
-                    bottom: -2px;
-                    left: 0;
-                    width: 60px;
-                    height: 2px;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                }}
-                
-                h2 {{
-                    font-size: 1.8rem;
-                    color: #4a5568;
-                    margin: 35px 0 15px 0;
-                    padding-bottom: 10px;
-                    border-bottom: 1px solid #e2e8f0;
-                }}
-                
-                h3 {{
-                    font-size: 1.4rem;
-                    color: #2d3748;
-                    margin: 25px 0 10px 0;
-                }}
-                
-                h4 {{
-                    font-size: 1.2rem;
-                    color: #4a5568;
-                    margin: 20px 0 8px 0;
-                }}
-                
-                p {{
-                    margin-bottom: 15px;
-                    color: #4a5568;
-                }}
-                
-                ul, ol {{
-                    margin: 15px 0;
-                    padding-left: 25px;
-                }}
-                
-                li {{
-                    margin-bottom: 8px;
-                    color: #4a5568;
-                }}
-                
-                table {{
-                    border-collapse: collapse;
-                    width: 100%;
-                    margin: 25px 0;
-                    background: white;
-                    border-radius: 8px;
-                    overflow: hidden;
-                    box-shadow: 0 4px 15px rgba(0,0,0,0.08);
-                }}
-                
-                th {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 15px;
-                    text-align: left;
-                    font-weight: 600;
-                    font-size: 0.95rem;
-                }}
-                
-                td {{
-                    padding: 15px;
-                    border-bottom: 1px solid #e2e8f0;
-                    color: #4a5568;
-                }}
-                
-                tr:nth-child(even) {{
-                    background-color: #f7fafc;
-                }}
-                
-                tr:hover {{
-                    background-color: #edf2f7;
-                }}
-                
-                code {{
-                    background: linear-gradient(135deg, #f7fafc 0%, #edf2f7 100%);
-                    padding: 4px 8px;
-                    border-radius: 6px;
-                    font-family: 'Fira Code', 'Courier New', monospace;
-                    font-size: 0.9rem;
-                    color: #e53e3e;
-                    border: 1px solid #e2e8f0;
-                }}
-                
-                pre {{
-                    background: linear-gradient(135deg, #f7fafc 0%, #edf2f7 100%);
-                    padding: 20px;
-                    border-radius: 8px;
-                    overflow-x: auto;
-                    border: 1px solid #e2e8f0;
-                    margin: 20px 0;
-                }}
-                
-                pre code {{
-                    background: none;
-                    padding: 0;
-                    border: none;
-                    color: #2d3748;
-                }}
-                
-                strong {{
-                    color: #2d3748;
-                    font-weight: 600;
-                }}
-                
-                .highlight {{
-                    background: linear-gradient(135deg, #fef5e7 0%, #fed7d7 100%);
-                    padding: 2px 6px;
-                    border-radius: 4px;
-                    font-weight: 600;
-                }}
-                
-                .skill-tag {{
-                    display: inline-block;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 4px 12px;
-                    border-radius: 20px;
-                    font-size: 0.85rem;
-                    font-weight: 500;
-                    margin: 2px;
-                }}
-                
-                .section-divider {{
-                    height: 2px;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    margin: 40px 0;
-                    border-radius: 1px;
-                }}
-                
-                @media (max-width: 768px) {{
-                    .report-container {{
-                        padding: 20px;
-                        margin: 10px;
-                    }}
-                    
-                    .report-title {{
-                        font-size: 2rem;
-                    }}
-                    
-                    h1 {{
-                        font-size: 1.8rem;
-                    }}
-                    
-                    h2 {{
-                        font-size: 1.5rem;
-                    }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="report-container">
-                <div class="report-header">
-                    <h1 class="report-title">
-                        <i class="fas fa-brain"></i>
-                        AI Skill Gap Analysis Report
-                    </h1>
-                    <p class="report-subtitle">Comprehensive CV Analysis with AI-Powered Insights</p>
-                </div>
-                
-                <a href="/" class="back-button">
-                    <i class="fas fa-arrow-left"></i>
-                    Back to Analysis
-                </a>
-                
-                <div class="section-divider"></div>
-                
-                {html_content}
-            </div>
-        </body>
-        </html>
-        """
-    except Exception as e:
+        page = rendered_report(report_path, report_stat.st_mtime_ns)[encoding]
+    except OSError as e:
+        logger.error(f"Failed to read report {report_path}: {e}")
         return f"<h1>Error Loading Report</h1><p>Failed to load report: {str(e)}</p>", 500
+    
+    response = make_response(page)
+    response.mimetype = 'text/html'
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    return cache_report_response(response)
+
+def preferred_report_encoding() -> str:
+    """Pick the best pre-compressed report encoding the client accepts."""
+    if zstandard is not None and request.accept_encodings['zstd']:
+        return 'zstd'
+    if request.accept_encodings['gzip']:
+        return 'gzip'
+    return 'identity'
+
+@functools.lru_cache(maxsize=REPORT_CACHE_SIZE)
+def rendered_report(report_path: str, mtime_ns: int) -> Dict[str, bytes]:
+    """Render and compress a report page once per version of its markdown file."""
+    with open(report_path, 'r', encoding='utf-8') as f:
+        report_content = f.read()
+    
+    # Convert markdown to HTML for better display
+    html = build_report_page(render_markdown(report_content)).encode('utf-8')
+    
+    # Compress at the highest levels, since this only happens once per report
+    encodings = {'identity': html, 'gzip': gzip.compress(html, 9)}
+    if zstandard is not None:
+        encodings['zstd'] = zstandard.ZstdCompressor(level=19).compress(html)
+    return encodings
+
+def render_markdown(report_content: str) -> str:
+    """Convert report markdown to HTML, preferring markdown-it-py when installed."""
+    if markdown_renderer is not None:
+        return markdown_renderer.render(report_content)
+    return markdown.markdown(report_content, extensions=['tables', 'fenced_code'])
+
+def build_report_page(html_content: str) -> str:
+    """Wrap rendered report HTML in the report page layout."""
+    # Flask compiles frontend/report.html once and keeps it in the template cache
+    return render_template('report.html', html_content=html_content)
 
 @socketio.on('connect')
 def handle_connect():
     """Handle WebSocket connection."""
-    logger.info("Client connected to analysis server")
-    emit('connected', {'message': 'Connected to analysis server'})
+    logger.debug("Client connected to analysis server")
+    emit('connected', CONNECTED_MESSAGE)
 
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle WebSocket disconnection."""
     logger.debug("Client disconnected from analysis server")
 
+def finished_session_updates(analysis) -> List[Dict[str, Any]]:
+    """Updates that bring a client up to date with a finished analysis, or [] if it is still going."""
+    if analysis.get('status') == 'completed' and 'result' in analysis:
+        updates = [{
+            'type': 'agent_status',
+            'agent': agent_id,
+            'status': 'Completed',
+            'status_class': 'completed'
+        } for agent_id in AGENT_PROGRESS]
+        updates.append({
+            'type': 'progress',
+            'percent': 100,
+            'message': 'Analysis complete!',
+            'stage': 'complete'
+        })
+        updates.append({'type': 'result', 'result': analysis['result']})
+        return updates
+    if analysis.get('status') == 'failed':
+        return [{
+            'type': 'error',
+            'message': f"Analysis failed: {analysis.get('error', 'unknown error')}"
+        }]
+    return []
+
 @socketio.on('join_analysis')
 def handle_join_analysis(data):
     """Join analysis session for real-time updates."""
@@ -1000,27 +1456,33 @@ def handle_join_analysis(data):
     if session_id:
         join_room(session_id)
         emit('joined', {'session_id': session_id})
+        
+        # A quick analysis (a cache hit, say) can finish before the client joins,
+        # sending its updates to an empty room, so the outcome is replayed here
+        analysis = get_active_analysis(session_id)
+        updates = finished_session_updates(analysis) if analysis else []
+        if updates:
+            emit('analysis_update_batch', updates)
 
 if __name__ == '__main__':
     # Create reports directory
-    Path('reports').mkdir(exist_ok=True)
-    
-    # Determine if running in production mode
-    is_production = os.environ.get('FLASK_ENV') == 'production'
-    debug_mode = not is_production
+    reports_dir()
     
     # Start the Flask-SocketIO server
-    port = int(os.environ.get('PORT', 5001))  # Use port 5001 by default, or PORT env var
     logger.info("Starting AI Skill Gap Analyst Web Server...")
-    logger.info(f"Environment: {'Production' if is_production else 'Development'}")
-    logger.info(f"Access the application at: http://localhost:{port}")
+    logger.info(f"Environment: {'Production' if settings.is_production else 'Development'}")
+    logger.info(f"Debug mode: {'On' if settings.debug else 'Off'}")
+    logger.info(f"Access the application at: http://localhost:{settings.port}")
+    logger.info(f"Socket.IO async mode: {socketio.async_mode}")
     
-    if is_production:
-        logger.warning("Running in production mode. Use Gunicorn for production deployment.")
-        logger.warning("Run: gunicorn --config gunicorn.conf.py wsgi:application")
+    if settings.is_production and socketio.async_mode == 'threading':
+        logger.warning("Running in production mode on the Werkzeug server. Install the 'server' extra for eventlet.")
+        logger.warning("Run: SOCKETIO_ASYNC_MODE=eventlet gunicorn -k eventlet -w 1 --worker-connections 1000 -b 0.0.0.0:5001 app:app")
     
+    # The unsafe flag only applies to the Werkzeug server used in threading mode,
+    # which is fine for local development but not for production
     socketio.run(app, 
                 host='0.0.0.0', 
-                port=port, 
-                debug=debug_mode,
-                allow_unsafe_werkzeug=debug_mode)
+                port=settings.port, 
+                debug=settings.debug,
+                allow_unsafe_werkzeug=not settings.is_production and socketio.async_mode == 'threading')
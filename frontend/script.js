@@ -124,8 +124,9 @@ function initializeWebSocket() {
             console.log('Joined session:', data.session_id);
         });
         
-        socket.on('analysis_update', function(data) {
-            handleAnalysisUpdate(data);
+        // The server sends analysis updates in batches, even when there is only one
+        socket.on('analysis_update_batch', function(events) {
+            events.forEach(handleAnalysisUpdate);
         });
         
     } catch (error) {
@@ -148,7 +149,7 @@ function handleAnalysisUpdate(data) {
             break;
             
         case 'log':
-            addLogEntry(data.level, data.message);
+            addLogEntry(data.level, data.message, data.ts);
             break;
             
         case 'result':
@@ -178,7 +179,7 @@ function updateProgress(percent, message) {
     }
 }
 
-function addLogEntry(level, message) {
+function addLogEntry(level, message, ts) {
     // Add log entry to a log section if it exists
     const logContainer = document.getElementById('logContainer');
     const logSection = document.getElementById('logSection');
@@ -191,7 +192,7 @@ function addLogEntry(level, message) {
         
         const logEntry = document.createElement('div');
         logEntry.className = `log-entry log-${level.toLowerCase()}`;
-        logEntry.innerHTML = `<span class="log-time">${new Date().toLocaleTimeString()}</span> <span class="log-level">[${level}]</span> ${message}`;
+        logEntry.innerHTML = `<span class="log-time">${(ts ? new Date(ts * 1000) : new Date()).toLocaleTimeString()}</span> <span class="log-level">[${level}]</span> ${message}`;
         logContainer.appendChild(logEntry);
         logContainer.scrollTop = logContainer.scrollHeight;
     }
@@ -284,23 +285,25 @@ async function startAnalysis() {
     showProgressSection();
     
     try {
-        const formData = new FormData();
-        formData.append('file', selectedFile);
-        formData.append('role', targetRole.value.trim());
-        
-        // Add configuration data
-        formData.append('model', modelSelect.value);
-        formData.append('api_source', apiSourceSelect.value);
-        formData.append('extraction_method', extractionSelect.value);
-        formData.append('analysis_mode', document.querySelector('input[name="analysisMode"]:checked').value);
-        
-        // Set RAG based on API source selection
-        formData.append('use_rag', apiSourceSelect.value === 'rag' ? 'true' : 'false');
-        formData.append('verbose', 'true');
+        // Send the raw file as the request body so the server can stream it to disk
+        const params = new URLSearchParams({
+            model: modelSelect.value,
+            api_source: apiSourceSelect.value,
+            extraction_method: extractionSelect.value,
+            analysis_mode: document.querySelector('input[name="analysisMode"]:checked').value,
+            // Set RAG based on API source selection
+            use_rag: apiSourceSelect.value === 'rag' ? 'true' : 'false',
+            verbose: 'true'
+        });
         
-        const response = await fetch('/api/analyze', {
+        const response = await fetch(`/api/analyze/stream?${params}`, {
             method: 'POST',
-            body: formData
+            headers: {
+                'Content-Type': 'application/octet-stream',
+                'X-Filename': encodeURIComponent(selectedFile.name),
+                'X-Target-Role': encodeURIComponent(targetRole.value.trim())
+            },
+            body: selectedFile
         });
         
         if (!response.ok) {
@@ -310,6 +313,10 @@ async function startAnalysis() {
         const result = await response.json();
         currentSessionId = result.session_id;
         
+        if (result.queue_position > 0) {
+            addLogEntry('INFO', `Server busy: your analysis is number ${result.queue_position} in the queue.`);
+        }
+        
         // Join the analysis session for real-time updates
         if (socket && currentSessionId) {
             socket.emit('join_analysis', { session_id: currentSessionId });
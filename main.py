@@ -1,41 +1,38 @@
 #!/usr/bin/env python3
 """
-Main CLI interface for CV Skill Gap Analysis System using Typer
+Main CLI interface for CV Skill Gap Analysis System using argparse
 
 Usage:
     python main.py analyze path/to/cv.txt "Senior AI Engineer" --output report.md
     uv run python main.py analyze data/sample_cv.txt "Senior AI Engineer"
 """
 
+from __future__ import annotations
+
+import argparse
+import hashlib
 import logging
+import multiprocessing
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Optional
 import os
-from dotenv import load_dotenv
-
-import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-
-# Load environment variables from .env file
-load_dotenv()
 
-from src.orchestrator.workflow import run_analysis
-from src.schemas import AnalysisState
+if TYPE_CHECKING:
+    from src.schemas import AnalysisState
 
-# I'm using Typer to create a command-line interface and Rich to display nice console output.
-app = typer.Typer(
-    name="ai-skill-gap-analyst",
-    help="A CV skill gap analysis system I built using LangGraph.",
-    add_completion=False
-)
-console = Console()
+# I'm using argparse for the command-line interface, since it starts instantly,
+# and Rich to display nice console output. Rich, dotenv and the workflow are only
+# imported by the analyze command, so `version` and `--help` don't pay for them.
 
 
 def setup_logging(verbose: bool = False) -> None:
     """Setup logging configuration."""
+    # basicConfig ignores repeat calls (demo re-enters analyze), so don't build handlers for nothing
+    if logging.getLogger().handlers:
+        return
     level = logging.DEBUG if verbose else logging.INFO
     
     logging.basicConfig(
@@ -43,13 +40,146 @@ def setup_logging(verbose: bool = False) -> None:
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
             logging.StreamHandler(sys.stdout),
-            logging.FileHandler('analysis.log')
+            # The log file is only opened once something is actually logged
+            logging.FileHandler('analysis.log', delay=True)
         ]
     )
 
 
-def load_cv_file(cv_path: str) -> str:
+# Extracted PDF texts older than this many seconds are deleted from the disk cache
+CV_TEXT_CACHE_MAX_AGE = int(os.getenv('CV_TEXT_CACHE_MAX_AGE', 7 * 24 * 3600))
+
+
+def extracted_text_cache_path(cv_file: Path) -> Optional[Path]:
+    # Extracted PDF text lives under CACHE_DIR, named by the SHA-256 of the PDF itself.
+    if os.getenv('ENABLE_CACHING', 'true').lower() != 'true':
+        return None
+    digest = hashlib.sha256(cv_file.read_bytes()).hexdigest()
+    return Path(os.getenv('CACHE_DIR', '.cache')) / 'cv' / f"{digest}.txt"
+
+
+def purge_extracted_text_cache(cache_dir: Path) -> None:
+    # CVs hold personal data, so I don't keep their text around longer than CV_TEXT_CACHE_MAX_AGE.
+    cutoff = time.time() - CV_TEXT_CACHE_MAX_AGE
+    for path in cache_dir.glob('*.txt'):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
+# Text shorter than this means an extractor missed the content, so the next one gets a try
+PDF_MIN_TEXT_LENGTH = 50
+# PDFs with at least this many pages have their pages extracted in parallel. pdfium reads
+# a text-heavy page in about a millisecond, while starting the worker processes costs
+# tens of milliseconds, so ordinary CVs are always faster read in one process.
+PDF_PARALLEL_MIN_PAGES = 64
+
+
+def extract_pdf_text(cv_file: Path) -> str:
+    # I try the quick text extractors first and only fall back to pdfplumber's
+    # full layout analysis when they come back with next to nothing.
+    extractors = (extract_text_pdfium, extract_text_pypdf2, extract_text_pdfplumber)
+    best = ""
+    found_extractor = False
+    last_error = None
+    
+    for extractor in extractors:
+        try:
+            content = extractor(cv_file)
+        except ImportError:
+            continue
+        except Exception as e:
+            found_extractor = True
+            last_error = e
+            continue
+        
+        found_extractor = True
+        if len(content) > PDF_MIN_TEXT_LENGTH:
+            return content
+        if len(content) > len(best):
+            best = content
+    
+    if not found_extractor:
+        raise ValueError("To process PDFs, you need to install 'pypdfium2', 'PyPDF2' or 'pdfplumber'.")
+    if best:
+        return best
+    if last_error is not None:
+        raise ValueError(f"Failed to get text from the PDF: {str(last_error)}")
+    raise ValueError("This PDF seems to be empty or has no text.")
+
+
+def extract_text_pdfium(cv_file: Path) -> str:
+    # pypdfium2 reads the text layer directly, which is the fastest option.
+    import pypdfium2 as pdfium
+    
+    pdf = pdfium.PdfDocument(str(cv_file))
+    try:
+        page_count = len(pdf)
+        parallel = page_count >= PDF_PARALLEL_MIN_PAGES and can_fork_page_workers()
+        if not parallel:
+            pages = [pdfium_page_text(pdf, index) for index in range(page_count)]
+    finally:
+        pdf.close()
+    
+    if parallel:
+        # Long documents are split across processes; each one opens the PDF itself
+        workers = min(page_count, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pages = list(executor.map(extract_pdfium_page, [str(cv_file)] * page_count, range(page_count)))
+    
+    # pdfium ends lines with \r\n; the parsers downstream split on \n
+    return "\n".join(filter(None, pages)).replace("\r\n", "\n").strip()
+
+
+def can_fork_page_workers() -> bool:
+    # The web app already runs extraction inside its worker pool, and a pool per
+    # analysis there would multiply the process count, so only the CLI fans out.
+    return multiprocessing.parent_process() is None and (os.cpu_count() or 1) > 1
+
+
+def extract_pdfium_page(pdf_path: str, index: int) -> str:
+    # Runs in a worker process, so it can't share the caller's open document.
+    import pypdfium2 as pdfium
+    
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        return pdfium_page_text(pdf, index)
+    finally:
+        pdf.close()
+
+
+def pdfium_page_text(pdf, index: int) -> str:
+    page = pdf[index]
+    textpage = page.get_textpage()
+    try:
+        return textpage.get_text_range()
+    finally:
+        textpage.close()
+        page.close()
+
+
+def extract_text_pypdf2(cv_file: Path) -> str:
+    import PyPDF2
+    
+    with open(cv_file, 'rb') as pdf_file:
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        return "\n".join(filter(None, (page.extract_text() for page in pdf_reader.pages))).strip()
+
+
+def extract_text_pdfplumber(cv_file: Path) -> str:
+    # pdfplumber runs a full layout analysis: slowest, but it copes with awkward layouts.
+    import pdfplumber
+    
+    with pdfplumber.open(cv_file) as pdf:
+        return "\n".join(filter(None, (page.extract_text() for page in pdf.pages))).strip()
+
+
+def load_cv_file(cv_path: str, use_disk_cache: bool = False) -> str:
     # This function handles loading the CV content. It can take both text and PDF files.
+    # Only the CLI turns on the disk cache of extracted PDF text; the web app deletes
+    # uploads once they're analysed and shouldn't leave their text behind.
     cv_file = Path(cv_path)
     
     if not cv_file.exists():
@@ -62,55 +192,27 @@ def load_cv_file(cv_path: str) -> str:
     file_extension = cv_file.suffix.lower()
     
     if file_extension == '.pdf':
-        # For PDFs, I'm trying pdfplumber first as it's generally better.
-        try:
-            import pdfplumber
-            
-            with pdfplumber.open(cv_file) as pdf:
-                content = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        content += page_text + "\n"
-                
-                content = content.strip()
-                
-                if not content:
-                    raise ValueError("This PDF seems to be empty or has no text.")
-                
-                return content
-                
-        except ImportError:
-            # If pdfplumber isn't installed, I'll try PyPDF2 as a fallback.
+        # Pulling text out of a PDF is slow, so I keep the result on disk, keyed by the file's bytes.
+        cache_file = extracted_text_cache_path(cv_file) if use_disk_cache else None
+        if cache_file is not None and cache_file.exists():
+            return cache_file.read_text(encoding='utf-8')
+        
+        content = extract_pdf_text(cv_file)
+        if cache_file is not None:
             try:
-                import PyPDF2
-                
-                with open(cv_file, 'rb') as pdf_file:
-                    pdf_reader = PyPDF2.PdfReader(pdf_file)
-                    content = ""
-                    
-                    for page in pdf_reader.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            content += page_text + "\n"
-                    
-                    content = content.strip()
-                    
-                    if not content:
-                        raise ValueError("This PDF seems to be empty or has no text.")
-                    
-                    return content
-                    
-            except ImportError:
-                raise ValueError("To process PDFs, you need to install either 'pdfplumber' or 'PyPDF2'.")
-        except Exception as e:
-            raise ValueError(f"Failed to get text from the PDF: {str(e)}")
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                tmp_file.write_text(content, encoding='utf-8')
+                tmp_file.replace(cache_file)
+                purge_extracted_text_cache(cache_file.parent)
+            except OSError:
+                pass
+        return content
     
     else:
         # For other file types, I'll just treat them as plain text.
         try:
-            with open(cv_file, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
+            content = cv_file.read_text(encoding='utf-8').strip()
             
             if not content:
                 raise ValueError("The CV file is empty.")
@@ -141,73 +243,78 @@ def save_report(report_content: str, output_path: str) -> None:
 
 def print_analysis_summary(state: AnalysisState) -> None:
     """Print a summary of the analysis results."""
-    print("\n" + "="*60)
-    print("ANALYSIS SUMMARY")
-    print("="*60)
+    from src.schemas import SummaryStats
+    
+    # The summary is collected first and written in one go, so it stays in one piece when piped
+    lines = ["", "="*60, "ANALYSIS SUMMARY", "="*60]
     
     # Basic info
     candidate_name = state.cv_structured.personal.name or "Unknown"
-    print(f"Candidate: {candidate_name}")
-    print(f"Target Role: {state.target_role}")
+    lines.append(f"Candidate: {candidate_name}")
+    lines.append(f"Target Role: {state.target_role}")
+    
+    # Counts come precomputed from the report node; older cached results lack them
+    stats = state.summary_stats or SummaryStats.from_state(state)
     
     # Parsing results
-    sections_found = 0
-    if state.cv_structured.personal.name:
-        sections_found += 1
-    if state.cv_structured.experience:
-        sections_found += 1
-    if any([state.cv_structured.skills.languages, state.cv_structured.skills.frameworks, state.cv_structured.skills.tools]):
-        sections_found += 1
-    if state.cv_structured.education:
-        sections_found += 1
-    if state.cv_structured.projects:
-        sections_found += 1
-    
-    print(f"CV Sections Parsed: {sections_found}/5")
+    lines.append(f"CV Sections Parsed: {stats.sections_found}/5")
     
     # Skills analysis
-    tech_skills = len(state.skills_analysis.explicit_skills.get('tech', []))
-    implicit_skills = len(state.skills_analysis.implicit_skills)
     years_exp = state.skills_analysis.seniority_indicators.years_exp
     
-    print(f"Technical Skills: {tech_skills}")
-    print(f"Implicit Skills: {implicit_skills}")
-    print(f"Experience: {years_exp} years")
+    lines.append(f"Technical Skills: {stats.tech_skills}")
+    lines.append(f"Implicit Skills: {stats.implicit_skills}")
+    lines.append(f"Experience: {years_exp} years")
     
     # Market intelligence
     demand_level = state.market_intelligence.market_insights.demand_level
     salary_range = state.market_intelligence.market_insights.salary_range
     
-    print(f"Market Demand: {demand_level}")
-    print(f"Salary Range: {salary_range}")
+    lines.append(f"Market Demand: {demand_level}")
+    lines.append(f"Salary Range: {salary_range}")
     
     # Report status
-    report_length = len(state.final_report) if state.final_report else 0
-    print(f"Report Generated: {report_length:,} characters")
+    lines.append(f"Report Generated: {stats.report_length:,} characters")
     
     # Errors
     if state.errors:
-        print(f"Warnings/Errors: {len(state.errors)}")
+        lines.append(f"Warnings/Errors: {len(state.errors)}")
         for error in state.errors[:3]:  # Show first 3 errors
-            print(f"   • {error}")
+            lines.append(f"   • {error}")
         if len(state.errors) > 3:
-            print(f"   • ... and {len(state.errors) - 3} more")
+            lines.append(f"   • ... and {len(state.errors) - 3} more")
     else:
-        print("No errors detected")
+        lines.append("No errors detected")
     
-    print("="*60)
+    lines.append("="*60)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def cli_cache_model() -> str:
+    # The provider and pipeline switches decide what the analysis produces, so they are part of the cache key.
+    switches = ('USE_RAG', 'USE_LLM_ANALYST', 'USE_LLM_REPORT', 'USE_SIMPLE_MODE')
+    flags = ','.join(f"{name}={os.getenv(name, '')}" for name in switches)
+    return f"cli:{os.getenv('LLM_PROVIDER', 'auto')}:{flags}"
 
 
-@app.command()
 def analyze(
-    cv_path: Path = typer.Argument(..., help="Path to the CV file.", exists=True, file_okay=True, dir_okay=False),
-    role: str = typer.Argument(..., help="The target role, like 'Senior AI Engineer'."),
-    output: Path = typer.Option("report.md", "--output", "-o", help="Where to save the report."),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable more detailed logging."),
-    use_simple: bool = typer.Option(False, "--simple", help="Use a simpler, non-LangGraph orchestrator.")
+    cv_path: Path,
+    role: str,
+    output: Path = Path("report.md"),
+    verbose: bool = False,
+    use_simple: bool = False,
+    no_cache: bool = False
 ):
     # This is the main command for the CLI.
+    from dotenv import load_dotenv
+    from rich.console import Console
+    
+    # Load environment variables from .env file before the workflow reads them
+    load_dotenv()
+    from src.orchestrator.workflow import run_analysis
+    from src.cache.analysis_cache import AnalysisCache, cache_key
     
+    console = Console()
     setup_logging(verbose)
     logger = logging.getLogger(__name__)
     
@@ -219,20 +326,39 @@ def analyze(
     try:
         # First, load the CV content from the file.
         console.print("\nLoading CV content...")
-        cv_content = load_cv_file(str(cv_path))
+        cv_content = load_cv_file(str(cv_path), use_disk_cache=not no_cache)
         logger.info(f"Loaded a CV with {len(cv_content)} characters.")
         
-        # Then, run the analysis workflow.
-        console.print("Running the analysis workflow...")
+        # If I've analyzed this CV for the same role and settings before, I reuse that result.
+        cache = None if no_cache else AnalysisCache()
+        cache_config = (cli_cache_model(),
+                        'spacy' if os.getenv('USE_SPACY_PARSER', 'false').lower() == 'true' else 'regex_ner')
+        key = cache_key(cv_content, role, *cache_config)
+        result_state = cache.get(key, cv_content, role, *cache_config) if cache else None
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Running the analysis pipeline...", total=None)
-            result_state = run_analysis(cv_content, role)
-            progress.update(task, completed=True)
+        if result_state is not None:
+            console.print("Using the cached analysis for this CV and role.")
+        else:
+            # Then, run the analysis workflow.
+            console.print("Running the analysis workflow...")
+            
+            # The spinner only makes sense on a terminal; piped and CI runs skip its render thread.
+            if console.is_terminal:
+                from rich.progress import Progress, SpinnerColumn, TextColumn
+                
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=console,
+                ) as progress:
+                    task = progress.add_task("Running the analysis pipeline...", total=None)
+                    result_state = run_analysis(cv_content, role)
+                    progress.update(task, completed=True)
+            else:
+                result_state = run_analysis(cv_content, role)
+            
+            if cache:
+                cache.set(key, result_state, cv_content, role, *cache_config)
         
         # Show a summary in the console.
         print_analysis_summary(result_state)
@@ -247,47 +373,45 @@ def analyze(
                 console.print("Errors found:")
                 for error in result_state.errors:
                     console.print(f"  - {error}")
-            raise typer.Exit(1)
+            sys.exit(1)
         
         console.print("\nAnalysis complete!", style="bold green")
         console.print(f"You can find the report in: {output}")
         
     except FileNotFoundError as e:
         console.print(f"Error: {str(e)}", style="bold red")
-        raise typer.Exit(1)
+        sys.exit(1)
     
     except ValueError as e:
         console.print(f"Error: {str(e)}", style="bold red")
-        raise typer.Exit(1)
+        sys.exit(1)
     
     except KeyboardInterrupt:
         console.print("\nAnalysis stopped by user.")
-        raise typer.Exit(1)
+        sys.exit(1)
     
     except Exception as e:
         logger.error(f"An unexpected error occurred: {str(e)}", exc_info=True)
         console.print(f"An unexpected error occurred: {str(e)}", style="bold red")
         console.print("Check the analysis.log file for more details.")
-        raise typer.Exit(1)
+        sys.exit(1)
 
 
-@app.command()
 def version():
     """Show version information."""
-    console.print("AI Skill Gap Analyst v0.1.0")
-    console.print("LangGraph-based multi-agent CV analysis system")
+    print("AI Skill Gap Analyst v0.1.0")
+    print("LangGraph-based multi-agent CV analysis system")
 
 
-@app.command()
 def demo():
     """Run a demo analysis with sample data."""
     sample_cv = Path("data/sample_cv.txt")
     if not sample_cv.exists():
-        console.print("Sample CV not found at data/sample_cv.txt", style="bold red")
-        console.print("Please ensure the sample data exists or use the analyze command with your own CV.")
-        raise typer.Exit(1)
+        print("Sample CV not found at data/sample_cv.txt")
+        print("Please ensure the sample data exists or use the analyze command with your own CV.")
+        sys.exit(1)
     
-    console.print("Running demo analysis with sample CV...")
+    print("Running demo analysis with sample CV...")
     analyze(
         cv_path=sample_cv,
         role="Senior AI Engineer",
@@ -297,5 +421,35 @@ def demo():
     )
 
 
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser with one sub-command per CLI command."""
+    parser = argparse.ArgumentParser(
+        prog="ai-skill-gap-analyst",
+        description="A CV skill gap analysis system I built using LangGraph."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    analyze_parser = commands.add_parser("analyze", help="Analyze a CV against a target role.")
+    analyze_parser.add_argument("cv_path", type=Path, help="Path to the CV file.")
+    analyze_parser.add_argument("role", help="The target role, like 'Senior AI Engineer'.")
+    analyze_parser.add_argument("--output", "-o", type=Path, default=Path("report.md"), help="Where to save the report.")
+    analyze_parser.add_argument("--verbose", "-v", action="store_true", help="Enable more detailed logging.")
+    analyze_parser.add_argument("--simple", dest="use_simple", action="store_true",
+                                help="Use a simpler, non-LangGraph orchestrator.")
+    analyze_parser.add_argument("--no-cache", action="store_true",
+                                help="Always run the analysis, ignoring cached results.")
+    
+    commands.add_parser("version", help="Show version information.")
+    commands.add_parser("demo", help="Run a demo analysis with sample data.")
+    return parser
+
+
+def app(argv: Optional[list] = None) -> None:
+    """Parse the command line and run the selected command."""
+    args = vars(build_parser().parse_args(argv))
+    command = {"analyze": analyze, "version": version, "demo": demo}[args.pop("command")]
+    command(**args)
+
+
 if __name__ == "__main__":
     app()
@@ -1,11 +1,17 @@
 import re
 import os
+import copy
 import json
+import hashlib
+import functools
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 import logging
 from datetime import datetime
 
+from cachetools import LRUCache
+
 from ..schemas import (
     AnalysisState, StructuredCV, PersonalInfo, Experience, 
     Skills, Education, Project
@@ -13,6 +19,243 @@ from ..schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Parsed CVs keyed by (parsing mode, digest of the raw text); parsing depends on
+# nothing else, as the configuration is shared process-wide
+_parse_cache: LRUCache = LRUCache(maxsize=256)
+_parse_cache_lock = threading.Lock()
+
+# Fixed patterns, compiled once at import
+_CV_HEADER_WORDS = ('curriculum', 'vitae', 'resume', 'cv')
+_CONTACT_KINDS = ('email', 'phone', 'linkedin', 'github')
+_CONTACT_PATTERNS = {
+    'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+    'linkedin': r'linkedin\.com/in/[\w-]+',
+    'github': r'github\.com/[\w-]+'
+}
+# Literal text every match of a contact kind contains (lowercase)
+_CONTACT_LITERALS = {'email': '@', 'linkedin': 'linkedin.com/in/', 'github': 'github.com/'}
+_PHONE_PATTERN = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
+_SPACY_PHONE_PATTERN = r'(\+?\d{1,3}[-.]\s?)?\(?\d{3}\)?[-.]\s?\d{3}[-.]\s?\d{4}'
+_DEGREE_REMOVE_RES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\b(?:bachelor|master|phd|doctorate|diploma|certificate)\b.*?(?:\d{4}|\b)',
+        r'\b(?:b\.?s\.?|m\.?s\.?|ph\.?d\.?)\b.*?(?:\d{4}|\b)',
+        r'\b(?:undergraduate|graduate)\b.*?(?:\d{4}|\b)',
+        r'\(\d{4}\)',
+        r'\d{4}'
+    )
+]
+_TRAILING_PUNCT_RE = re.compile(r'[,\-–]\s*$')
+_LEADING_PUNCT_RE = re.compile(r'^\s*[,\-–]\s*')
+_INSTITUTION_RES = [
+    re.compile(pattern) for pattern in (
+        # Full institution names
+        r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:University|College|Institute|School))\b',
+        # Abbreviated forms
+        r'\b(MIT|Stanford|Harvard|Berkeley|CMU|Caltech|UCLA|USC|NYU)\b',
+        # University of X pattern
+        r'\b(University\s+of\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b',
+        # X University pattern
+        r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+University)\b',
+        # X College pattern
+        r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+College)\b',
+        # X Institute pattern
+        r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Institute)\b'
+    )
+]
+_LEADING_DIGITS_RE = re.compile(r'^\d+')
+_FIELD_OF_STUDY_RES = [
+    re.compile(pattern) for pattern in (
+        r'in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+        r'of\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+        r'(?:major|concentration|specialization):\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
+    )
+]
+_PROJECT_SPLIT_RE = re.compile(r'\n\s*[-•]\s*|\n\s*\d+\.\s*')
+_EXPERIENCE_SPLIT_RE = re.compile(r'\n\s*(?=\w+.*(?:\d{4}|\w+\s+\d{4}))')
+_DATE_RANGE_RE = re.compile(r'(\d{4})\s*[-–]\s*(\d{4}|present|current)', re.IGNORECASE)
+_TRAILING_BRACKET_RE = re.compile(r'[()[\]]\s*$')
+_BULLET_MARKERS = ('•', '-', '*')
+_GLOBAL_FLAGS_RE = re.compile(r'^\(\?([imsx]+)\)')
+
+
+@functools.lru_cache(maxsize=32)
+def _contact_regex(patterns: tuple) -> re.Pattern:
+    """
+    Compile one pattern finding mentions of several contact kinds in a single scan.
+    
+    Each kind is a named group inside a lookahead, so mentions may overlap,
+    e.g. a GitHub URL inside an email domain.
+    
+    Args:
+        patterns: (kind, pattern) pairs, in order of precedence
+    """
+    alternation = '|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in patterns)
+    return re.compile(f'(?={alternation})', re.IGNORECASE)
+
+
+def _extract_contact(text: str, phone_pattern: str) -> Dict[str, str]:
+    """
+    Collect the first mention of each contact kind in the text.
+    
+    Kinds whose literal marker ("@", "linkedin.com/in/", "github.com/") is
+    absent are left out of the scan, which then stops as soon as every
+    remaining kind has been seen.
+    
+    Args:
+        text: CV text to search
+        phone_pattern: Phone number pattern of the calling parser mode
+        
+    Returns:
+        dict: Contact kind ("email", "phone", "linkedin", "github") mapped to
+             its first mention, for the kinds found
+    """
+    text_lower = text.lower()
+    patterns = tuple(
+        (kind, phone_pattern if kind == 'phone' else _CONTACT_PATTERNS[kind])
+        for kind in _CONTACT_KINDS
+        if kind == 'phone' or _CONTACT_LITERALS[kind] in text_lower
+    )
+    
+    found = {}
+    for match in _contact_regex(patterns).finditer(text):
+        found.setdefault(match.lastgroup, match.group(match.lastgroup))
+        if len(found) == len(patterns):
+            break
+    return {kind: found[kind] for kind in _CONTACT_KINDS if kind in found}
+
+
+def _is_cv_header(line: str) -> bool:
+    """Tell whether a line starts with a CV title word such as "Resume" or "Curriculum Vitae"."""
+    lowered = line[:11].lower()
+    for word in _CV_HEADER_WORDS:
+        if lowered.startswith(word):
+            following = lowered[len(word):len(word) + 1]
+            return not (following.isalnum() or following == '_')
+    return False
+
+
+def _list_item_text(line: str) -> Optional[str]:
+    """
+    Return the text of a bulleted or numbered line.
+    
+    Returns:
+        Optional[str]: The line without its leading "•", "-", "*" or "1." style
+             marker and the whitespace after it, or None if it has no marker
+    """
+    if line.startswith(_BULLET_MARKERS):
+        return line[1:].lstrip()
+    digits = len(line) - len(line.lstrip('0123456789'))
+    if digits and line[digits:digits + 1] == '.':
+        return line[digits + 1:].lstrip()
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def load_spacy_model():
+    """
+    Load the spaCy pipeline once per process and share it between parser instances.
+    
+    Raises:
+        ImportError: If spaCy is not installed
+        OSError: If en_core_web_sm model is not available
+    """
+    import spacy
+    return spacy.load("en_core_web_sm")
+
+
+@functools.lru_cache(maxsize=1)
+def load_parser_config() -> Dict:
+    """
+    Load CV parser configuration from JSON file once per process.
+    
+    Callers share the returned dict and must not modify it.
+    
+    Returns:
+        dict: Configuration containing section patterns, skill categories,
+             technology normalizations, and degree patterns
+             
+    Raises:
+        json.JSONDecodeError: If config file is invalid JSON
+    """
+    config_path = Path(__file__).parent.parent.parent / 'data' / 'cv_parser_config.json'
+    
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        logger.info(f"Loaded CV parser configuration from {config_path}")
+        return config
+    except FileNotFoundError:
+        logger.error(f"Configuration file not found: {config_path}")
+        # Fallback to minimal default configuration
+        return {
+            'section_patterns': {'experience': [], 'skills': [], 'education': [], 'projects': []},
+            'skill_categories': {'programming_languages': [], 'frameworks': [], 'tools': []},
+            'tech_normalizations': {},
+            'degree_patterns': []
+        }
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in configuration file: {e}")
+        raise
+
+
+@functools.lru_cache(maxsize=1)
+def compile_section_patterns() -> Dict[str, tuple]:
+    """
+    Compile the section heading patterns from the configuration once per process.
+    
+    The headings of all other sections are joined into one alternation, so a
+    single search finds where a section ends: the leftmost match of an
+    alternation is the earliest match of any of its branches.
+    
+    Returns:
+        dict: Section type mapped to (heading regexes in configuration order,
+             regexes finding the next section's heading)
+    """
+    section_patterns = load_parser_config()['section_patterns']
+    compiled = {
+        section_type: [re.compile(f'{pattern}:?\\s*\\n', re.IGNORECASE | re.MULTILINE) for pattern in patterns]
+        for section_type, patterns in section_patterns.items()
+    }
+    
+    def next_section_regexes(section_type: str) -> List[re.Pattern]:
+        others = [pattern for other_type, patterns in section_patterns.items() if other_type != section_type
+                  for pattern in patterns]
+        if not others:
+            return []
+        # Global flags such as (?i) are only allowed at the very start, so they become scoped groups
+        scoped = [_GLOBAL_FLAGS_RE.sub(r'(?\1:', pattern, count=1) + ')' if _GLOBAL_FLAGS_RE.match(pattern)
+                  else pattern for pattern in others]
+        try:
+            return [re.compile('|'.join(f'(?:{pattern}):?\\s*\\n' for pattern in scoped),
+                               re.IGNORECASE | re.MULTILINE)]
+        except re.error:
+            return [regex for other_type, regexes in compiled.items() if other_type != section_type
+                    for regex in regexes]
+    
+    return {
+        section_type: (regexes, next_section_regexes(section_type))
+        for section_type, regexes in compiled.items()
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def compile_degree_patterns() -> List[re.Pattern]:
+    """Compile the degree patterns from the configuration once per process."""
+    return [re.compile(pattern) for pattern in load_parser_config()['degree_patterns']]
+
+
+@functools.lru_cache(maxsize=32)
+def skills_regex(skills: tuple) -> re.Pattern:
+    """
+    Compile one pattern finding every whole-word mention of the given lowercase skills.
+    
+    Longer names come first so a skill wins over a shorter one starting at the
+    same position, and the lookahead lets mentions overlap.
+    """
+    alternation = '|'.join(re.escape(skill) for skill in sorted(set(skills), key=len, reverse=True))
+    return re.compile(r'(?=\b(' + alternation + r')\b)')
+
 
 class CVParserAgent:
     """
@@ -23,56 +266,35 @@ class CVParserAgent:
     easy maintenance and customization.
     
     Attributes:
-        use_spacy (bool): Whether to use spaCy NER mode (from USE_SPACY_PARSER env var)
+        use_spacy (bool): Whether to use spaCy NER mode (defaults to USE_SPACY_PARSER env var)
         config (dict): Loaded configuration including patterns and skill categories
         _spacy_nlp: Lazy-loaded spaCy model (only when USE_SPACY_PARSER=True)
     """
     
-    def __init__(self):
-        # Environment configuration
-        self.use_spacy = os.getenv('USE_SPACY_PARSER', 'true').lower() == 'true'
+    def __init__(self, use_spacy: Optional[bool] = None):
+        """
+        Initialize the parser.
+        
+        Args:
+            use_spacy: Whether to use spaCy NER mode; defaults to the
+                USE_SPACY_PARSER environment variable
+        """
+        if use_spacy is None:
+            use_spacy = os.getenv('USE_SPACY_PARSER', 'true').lower() == 'true'
+        self.use_spacy = use_spacy
         self._spacy_nlp = None  # Lazy-loaded spaCy model
         
-        # Load configuration from JSON file
-        self.config = self._load_config()
+        # Configuration is parsed once per process and shared by all instances
+        self.config = load_parser_config()
         
         # Extract frequently used patterns for performance
         self.section_patterns = self.config['section_patterns']
         self.tech_normalizations = self.config['tech_normalizations']
         self.skill_categories = self.config['skill_categories']
+        self.all_known_techs = [skill for category in self.skill_categories.values() for skill in category]
         self.degree_patterns = self.config['degree_patterns']
-    
-    def _load_config(self) -> Dict:
-        """
-        Load CV parser configuration from JSON file.
-        
-        Returns:
-            dict: Configuration containing section patterns, skill categories,
-                 technology normalizations, and degree patterns
-                 
-        Raises:
-            FileNotFoundError: If config file doesn't exist
-            json.JSONDecodeError: If config file is invalid JSON
-        """
-        config_path = Path(__file__).parent.parent.parent / 'data' / 'cv_parser_config.json'
-        
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            logger.info(f"Loaded CV parser configuration from {config_path}")
-            return config
-        except FileNotFoundError:
-            logger.error(f"Configuration file not found: {config_path}")
-            # Fallback to minimal default configuration
-            return {
-                'section_patterns': {'experience': [], 'skills': [], 'education': [], 'projects': []},
-                'skill_categories': {'programming_languages': [], 'frameworks': [], 'tools': []},
-                'tech_normalizations': {},
-                'degree_patterns': []
-            }
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in configuration file: {e}")
-            raise
+        self.degree_regexes = compile_degree_patterns()
+        self.section_regexes = compile_section_patterns()
     
     def run(self, state: AnalysisState) -> AnalysisState:
         """
@@ -103,10 +325,7 @@ class CVParserAgent:
                 return state
             
             # Parse using selected mode (spaCy model only loaded if needed)
-            if self.use_spacy:
-                structured_cv = self.parse_with_spacy(state.cv_raw)
-            else:
-                structured_cv = self.parse_with_regex(state.cv_raw)
+            structured_cv = self._parse_cached(state.cv_raw)
             
             # Quality checks
             sections_found = self._validate_extraction(structured_cv)
@@ -123,6 +342,32 @@ class CVParserAgent:
         
         return state
     
+    def _parse_cached(self, text: str) -> StructuredCV:
+        """
+        Parse CV text in the selected mode, reusing the result for text seen before.
+        
+        Args:
+            text (str): Raw CV text to parse
+            
+        Returns:
+            StructuredCV: A private copy of the parsed CV, safe for callers to modify
+        """
+        key = (self.use_spacy, hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest())
+        with _parse_cache_lock:
+            structured_cv = _parse_cache.get(key)
+        
+        if structured_cv is None:
+            if self.use_spacy:
+                structured_cv = self.parse_with_spacy(text)
+            else:
+                structured_cv = self.parse_with_regex(text)
+            with _parse_cache_lock:
+                _parse_cache[key] = structured_cv
+        else:
+            logger.debug("Reusing cached parse of identical CV text")
+        
+        return copy.deepcopy(structured_cv)
+    
     def parse_with_spacy(self, text: str) -> StructuredCV:
         """
         Parse CV text using spaCy Named Entity Recognition for intelligent extraction.
@@ -146,8 +391,7 @@ class CVParserAgent:
             Exception: Any spaCy-related errors trigger automatic fallback to regex parsing
             
         Example:
-            >>> parser = CVParserAgent()
-            >>> os.environ['USE_SPACY_PARSER'] = 'true'
+            >>> parser = CVParserAgent(use_spacy=True)
             >>> cv = parser.parse_with_spacy("John Doe\nSoftware Engineer at Google\n...")
             >>> print(cv.personal.name)  # "John Doe"
             >>> print(cv.experience[0].company)  # "Google"
@@ -189,8 +433,7 @@ class CVParserAgent:
             OSError: If en_core_web_sm model is not available
         """
         try:
-            import spacy
-            self._spacy_nlp = spacy.load("en_core_web_sm")
+            self._spacy_nlp = load_spacy_model()
             logger.info("spaCy model loaded successfully")
         except (ImportError, OSError) as e:
             logger.warning(f"Failed to load spaCy model: {e}. Falling back to regex parsing.")
@@ -275,34 +518,13 @@ class CVParserAgent:
         if lines:
             # Skip common headers and get the first substantial line
             for line in lines[:5]:  # Check first 5 lines
-                if not re.match(r'(?i)(curriculum|vitae|resume|cv)\b', line) and len(line) > 2:
+                if not _is_cv_header(line) and len(line) > 2:
                     personal.name = line
                     break
         
-        # Extract contact information
-        contact = {}
-        
-        # Email
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-        if email_match:
-            contact['email'] = email_match.group()
-        
-        # Phone
-        phone_match = re.search(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', text)
-        if phone_match:
-            contact['phone'] = phone_match.group()
-        
-        # LinkedIn
-        linkedin_match = re.search(r'linkedin\.com/in/[\w-]+', text, re.IGNORECASE)
-        if linkedin_match:
-            contact['linkedin'] = linkedin_match.group()
+        # Extract contact information (email, phone, LinkedIn, GitHub) in one scan
+        personal.contact = _extract_contact(text, _PHONE_PATTERN)
         
-        # GitHub
-        github_match = re.search(r'github\.com/[\w-]+', text, re.IGNORECASE)
-        if github_match:
-            contact['github'] = github_match.group()
-        
-        personal.contact = contact
         return personal
     
     def _extract_experience(self, text: str) -> List[Experience]:
@@ -373,15 +595,16 @@ class CVParserAgent:
         # Also extract from entire document for comprehensive coverage
         all_text = skills_section + "\n" + text if skills_section else text
         
-        # Extract skills using configuration-based categories
+        # Extract skills using configuration-based categories, lowercasing the text once for all of them
+        all_text_lower = all_text.lower()
         skills.languages = self._extract_skill_category(
-            all_text, self.skill_categories['programming_languages']
+            all_text, self.skill_categories['programming_languages'], all_text_lower
         )
         skills.frameworks = self._extract_skill_category(
-            all_text, self.skill_categories['frameworks']
+            all_text, self.skill_categories['frameworks'], all_text_lower
         )
         skills.tools = self._extract_skill_category(
-            all_text, self.skill_categories['tools']
+            all_text, self.skill_categories['tools'], all_text_lower
         )
         
         return skills
@@ -418,8 +641,8 @@ class CVParserAgent:
         edu_lines = [line.strip() for line in edu_section.split('\n') if line.strip()]
         
         # Use degree patterns from configuration
-        for pattern in self.degree_patterns:
-            matches = re.finditer(pattern, edu_section)
+        for regex in self.degree_regexes:
+            matches = regex.finditer(edu_section)
             for match in matches:
                 education = Education()
                 education.degree = match.group(1)
@@ -461,44 +684,21 @@ class CVParserAgent:
         clean_line = match_line
         
         # Remove common degree patterns
-        degree_remove_patterns = [
-            r'\b(?:bachelor|master|phd|doctorate|diploma|certificate)\b.*?(?:\d{4}|\b)',
-            r'\b(?:b\.?s\.?|m\.?s\.?|ph\.?d\.?)\b.*?(?:\d{4}|\b)',
-            r'\b(?:undergraduate|graduate)\b.*?(?:\d{4}|\b)',
-            r'\(\d{4}\)',
-            r'\d{4}'
-        ]
-        
-        for pattern in degree_remove_patterns:
-            clean_line = re.sub(pattern, '', clean_line, flags=re.IGNORECASE)
+        for regex in _DEGREE_REMOVE_RES:
+            clean_line = regex.sub('', clean_line)
         
         # Clean up extra punctuation and whitespace
-        clean_line = re.sub(r'[,\-–]\s*$', '', clean_line).strip()
-        clean_line = re.sub(r'^\s*[,\-–]\s*', '', clean_line).strip()
+        clean_line = _TRAILING_PUNCT_RE.sub('', clean_line).strip()
+        clean_line = _LEADING_PUNCT_RE.sub('', clean_line).strip()
         
         # Look for institution patterns
-        institution_patterns = [
-            # Full institution names
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:University|College|Institute|School))\b',
-            # Abbreviated forms
-            r'\b(MIT|Stanford|Harvard|Berkeley|CMU|Caltech|UCLA|USC|NYU)\b',
-            # University of X pattern
-            r'\b(University\s+of\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b',
-            # X University pattern
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+University)\b',
-            # X College pattern
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+College)\b',
-            # X Institute pattern
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Institute)\b'
-        ]
-        
-        for pattern in institution_patterns:
-            match = re.search(pattern, clean_line)
+        for regex in _INSTITUTION_RES:
+            match = regex.search(clean_line)
             if match:
                 return match.group(1).strip()
         
         # If no specific pattern found, return the cleaned line if it looks like an institution
-        if clean_line and len(clean_line) > 3 and not re.match(r'^\d+', clean_line):
+        if clean_line and len(clean_line) > 3 and not _LEADING_DIGITS_RE.match(clean_line):
             # Check if it contains institution keywords
             if any(keyword in clean_line.lower() for keyword in ['university', 'college', 'institute', 'school']):
                 return clean_line
@@ -516,14 +716,8 @@ class CVParserAgent:
             Field of study if found
         """
         # Common field patterns
-        field_patterns = [
-            r'in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'of\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-            r'(?:major|concentration|specialization):\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
-        ]
-        
-        for pattern in field_patterns:
-            match = re.search(pattern, line)
+        for regex in _FIELD_OF_STUDY_RES:
+            match = regex.search(line)
             if match:
                 field = match.group(1).strip()
                 # Filter out common non-field words
@@ -560,7 +754,7 @@ class CVParserAgent:
             return projects
         
         # Split into project blocks
-        project_blocks = re.split(r'\n\s*[-•]\s*|\n\s*\d+\.\s*', projects_section)
+        project_blocks = _PROJECT_SPLIT_RE.split(projects_section)
         
         for block in project_blocks:
             if len(block.strip()) < 10:  # Skip very short blocks
@@ -584,24 +778,19 @@ class CVParserAgent:
     
     def _find_section(self, text: str, section_type: str) -> str:
         """Find and extract a specific section from CV text."""
-        patterns = self.section_patterns.get(section_type, [])
+        regexes, next_section_regexes = self.section_regexes.get(section_type, ((), ()))
         
-        for pattern in patterns:
-            match = re.search(f'{pattern}:?\\s*\\n', text, re.IGNORECASE | re.MULTILINE)
+        for regex in regexes:
+            match = regex.search(text)
             if match:
                 start = match.end()
                 
                 # Find next section or end of text
-                next_section_patterns = []
-                for other_type, other_patterns in self.section_patterns.items():
-                    if other_type != section_type:
-                        next_section_patterns.extend(other_patterns)
-                
                 end = len(text)
-                for next_pattern in next_section_patterns:
-                    next_match = re.search(f'{next_pattern}:?\\s*\\n', text[start:], re.IGNORECASE | re.MULTILINE)
+                for next_regex in next_section_regexes:
+                    next_match = next_regex.search(text, start)
                     if next_match:
-                        end = min(end, start + next_match.start())
+                        end = min(end, next_match.start())
                 
                 return text[start:end].strip()
         
@@ -610,7 +799,7 @@ class CVParserAgent:
     def _split_experience_blocks(self, exp_text: str) -> List[str]:
         """Split experience section into individual job blocks."""
         # Split by common separators
-        blocks = re.split(r'\n\s*(?=\w+.*(?:\d{4}|\w+\s+\d{4}))', exp_text)
+        blocks = _EXPERIENCE_SPLIT_RE.split(exp_text)
         return [block.strip() for block in blocks if block.strip()]
     
     def _parse_experience_block(self, block: str) -> Experience:
@@ -633,14 +822,13 @@ class CVParserAgent:
         first_line = lines[0]
         
         # Look for date patterns and extract them
-        date_pattern = r'(\d{4})\s*[-–]\s*(\d{4}|present|current)'
-        date_match = re.search(date_pattern, first_line, re.IGNORECASE)
+        date_match = _DATE_RANGE_RE.search(first_line)
         if date_match:
             experience.dates = date_match.group()
             # Remove dates from first line to get company/title
-            first_line = re.sub(date_pattern, '', first_line, flags=re.IGNORECASE).strip()
+            first_line = _DATE_RANGE_RE.sub('', first_line).strip()
             # Clean up extra parentheses or brackets
-            first_line = re.sub(r'[()[\]]\s*$', '', first_line).strip()
+            first_line = _TRAILING_BRACKET_RE.sub('', first_line).strip()
         
         # Try to separate company and title using various patterns
         if ', ' in first_line and ' at ' not in first_line.lower():
@@ -681,29 +869,34 @@ class CVParserAgent:
         # Remaining lines are bullets
         bullets = []
         for line in lines[1:]:
-            if line.startswith(('•', '-', '*')) or re.match(r'^\d+\.', line):
-                bullets.append(re.sub(r'^[•\-*]\s*|\d+\.\s*', '', line))
-            elif line and not re.search(date_pattern, line, re.IGNORECASE):
+            item_text = _list_item_text(line)
+            if item_text is not None:
+                bullets.append(item_text)
+            elif line and not _DATE_RANGE_RE.search(line):
                 bullets.append(line)
         
         experience.bullets = bullets
         return experience
     
-    def _extract_skill_category(self, text: str, skill_list: List[str]) -> List[str]:
-        """Extract skills from a specific category."""
-        found_skills = []
-        text_lower = text.lower()
-        
+    def _extract_skill_category(self, text: str, skill_list: List[str],
+                                text_lower: Optional[str] = None) -> List[str]:
+        """Extract skills from a specific category, given text_lower if the caller already has it."""
+        if not skill_list:
+            return []
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # One scan finds every listed skill mentioned (word boundaries to avoid partial matches)
+        regex = skills_regex(tuple(skill.lower() for skill in skill_list))
+        mentioned = {match.group(1) for match in regex.finditer(text_lower)}
+        
+        # Normalize skill names in configuration order, removing duplicates
+        found_skills = {}
         for skill in skill_list:
-            # Normalize skill name
-            normalized_skill = self.tech_normalizations.get(skill.lower(), skill.lower())
-            
-            # Check for skill mentions (word boundaries to avoid partial matches)
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(normalized_skill)
-        
-        return list(set(found_skills))  # Remove duplicates
+            skill = skill.lower()
+            if skill in mentioned:
+                found_skills[self.tech_normalizations.get(skill, skill)] = None
+        return list(found_skills)
     
     def _extract_tech_from_text(self, text: str) -> List[str]:
         """
@@ -722,15 +915,8 @@ class CVParserAgent:
             Combines all skill categories (languages, frameworks, tools) for
             comprehensive technology detection in project contexts.
         """
-        all_techs = []
-        
-        # Combine all known technologies
-        # Combine all skill categories from configuration
-        all_known_techs = []
-        for category in self.skill_categories.values():
-            all_known_techs.extend(category)
-        
-        return self._extract_skill_category(text, all_known_techs)
+        # All skill categories from configuration, combined once in __init__
+        return self._extract_skill_category(text, self.all_known_techs)
     
     def _validate_extraction(self, cv: StructuredCV) -> int:
         """Validate the extraction quality and return number of sections found."""
@@ -776,29 +962,8 @@ class CVParserAgent:
             personal.name = self._extract_personal_info(text).name
         
         # Extract contact information (use regex as it's more reliable for structured data)
-        contact = {}
-        
-        # Email
-        email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
-        if email_match:
-            contact['email'] = email_match.group()
-        
-        # Phone
-        phone_match = re.search(r'(\+?\d{1,3}[-.]\s?)?\(?\d{3}\)?[-.]\s?\d{3}[-.]\s?\d{4}', text)
-        if phone_match:
-            contact['phone'] = phone_match.group()
-        
-        # LinkedIn
-        linkedin_match = re.search(r'linkedin\.com/in/[\w-]+', text, re.IGNORECASE)
-        if linkedin_match:
-            contact['linkedin'] = linkedin_match.group()
-        
-        # GitHub
-        github_match = re.search(r'github\.com/[\w-]+', text, re.IGNORECASE)
-        if github_match:
-            contact['github'] = github_match.group()
+        personal.contact = _extract_contact(text, _SPACY_PHONE_PATTERN)
         
-        personal.contact = contact
         return personal
     
     def _extract_experience_spacy(self, doc, text: str) -> List[Experience]:
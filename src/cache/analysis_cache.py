@@ -0,0 +1,270 @@
+"""
+Result cache for the CV analysis pipeline.
+Skips the multi-agent LLM workflow when the same (or a near-identical) CV is
+analyzed again for the same role and configuration.
+"""
+
+import os
+import json
+import time
+import pickle
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from cachetools import LRUCache
+
+from ..schemas import AnalysisState
+
+logger = logging.getLogger(__name__)
+
+# Cosine similarity above which two CVs are treated as the same document
+SEMANTIC_THRESHOLD = 0.92
+SEMANTIC_MODEL = 'all-MiniLM-L6-v2'
+
+
+def cache_key(cv_content: str, target_role: str, model: str = 'default',
+              extraction_method: str = 'default') -> str:
+    """Build the exact-match cache key for an analysis request."""
+    cv_sha = hashlib.sha256(cv_content.encode('utf-8')).hexdigest()
+    payload = json.dumps({
+        'cv_sha': cv_sha,
+        'role': target_role.strip().lower(),
+        'model': model,
+        'extraction_method': extraction_method
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _semantic_scope(target_role: str, model: str, extraction_method: str) -> Tuple[str, str, str]:
+    """Partition of the semantic index a request may match within."""
+    return (model, extraction_method, target_role.strip().lower())
+
+
+class _MemoryBackend:
+    """In-process fallback store used when neither Redis nor diskcache is available."""
+
+    def __init__(self, maxsize: int):
+        # Least recently used entries are evicted once maxsize is reached
+        self._data: LRUCache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        with self._lock:
+            self._data[key] = (time.time() + ttl, value)
+
+
+class _DiskBackend:
+    """Local on-disk store backed by diskcache."""
+
+    def __init__(self, cache_dir: str):
+        import diskcache
+        self._cache = diskcache.Cache(str(Path(cache_dir) / 'analysis'))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._cache.set(key, value, expire=ttl)
+
+
+class _RedisBackend:
+    """Shared store for multi-process deployments."""
+
+    def __init__(self, redis_url: str):
+        import redis
+        self._client = redis.Redis.from_url(redis_url)
+        self._client.ping()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(f"analysis:{key}")
+
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._client.setex(f"analysis:{key}", ttl, value)
+
+
+class _SemanticIndex:
+    """
+    Embedding index mapping near-duplicate CVs onto an exact cache key.
+    Requires sentence-transformers; FAISS is used when installed.
+
+    Entries are partitioned by scope (model, extraction method and normalized
+    role), so a CV is only ever matched against analyses of the same role made
+    with the same configuration.
+    """
+
+    def __init__(self, maxsize: int, threshold: float = SEMANTIC_THRESHOLD):
+        from sentence_transformers import SentenceTransformer
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._model = SentenceTransformer(SEMANTIC_MODEL)
+        # Cache key -> (scope, vector), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Tuple[str, str, str], Any]]" = OrderedDict()
+        # Scope -> (cache keys, vector matrix or FAISS index), rebuilt when its entries change
+        self._partitions: Dict[Tuple[str, str, str], Tuple[List[str], Any]] = {}
+        self._lock = threading.Lock()
+        try:
+            import faiss
+            self._faiss = faiss
+        except ImportError:
+            self._faiss = None
+            logger.info("FAISS not installed, using brute-force semantic lookup")
+
+    def _embed(self, cv_content: str, target_role: str):
+        # The model truncates long input, so the role goes first to stay in view
+        text = target_role + "\n" + cv_content[:4000]
+        return self._model.encode([text], normalize_embeddings=True).astype('float32')
+
+    def _partition(self, scope: Tuple[str, str, str]) -> Optional[Tuple[List[str], Any]]:
+        partition = self._partitions.get(scope)
+        if partition is None:
+            keys = [key for key, (entry_scope, _) in self._entries.items() if entry_scope == scope]
+            if not keys:
+                return None
+            import numpy as np
+            vectors = np.vstack([self._entries[key][1] for key in keys])
+            if self._faiss is not None:
+                index = self._faiss.IndexFlatIP(vectors.shape[1])
+                index.add(vectors)
+            else:
+                index = vectors
+            partition = self._partitions[scope] = (keys, index)
+        return partition
+
+    def lookup(self, cv_content: str, target_role: str, scope: Tuple[str, str, str]) -> Optional[str]:
+        vector = self._embed(cv_content, target_role)
+        with self._lock:
+            partition = self._partition(scope)
+            if partition is None:
+                return None
+            keys, index = partition
+            if self._faiss is not None:
+                scores, ids = index.search(vector, 1)
+                score, best = float(scores[0][0]), int(ids[0][0])
+            else:
+                sims = index @ vector[0]
+                best = int(sims.argmax())
+                score = float(sims[best])
+            key = keys[best]
+            if score >= self.threshold:
+                self._entries.move_to_end(key)
+        if score >= self.threshold:
+            logger.info(f"Semantic cache match (similarity {score:.3f})")
+            return key
+        return None
+
+    def add(self, key: str, cv_content: str, target_role: str, scope: Tuple[str, str, str]) -> None:
+        vector = self._embed(cv_content, target_role)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (scope, vector[0])
+            self._partitions.pop(scope, None)
+            while len(self._entries) > self.maxsize:
+                self._discard(next(iter(self._entries)))
+
+    def discard(self, key: str) -> None:
+        """Forget a key, e.g. once its analysis has expired from the exact tier."""
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._partitions.pop(entry[0], None)
+
+
+class AnalysisCache:
+    """
+    Two-tier cache for analysis results.
+
+    The exact tier stores pickled AnalysisState objects in Redis (REDIS_URL),
+    diskcache (CACHE_DIR) or process memory, in that order of preference.
+    The optional semantic tier (SEMANTIC_CACHE=true) resolves near-duplicate
+    CVs to an existing exact key.
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv('ENABLE_CACHING', 'true').lower() == 'true'
+        self.ttl = int(os.getenv('CACHE_TTL', 86400))
+        self._backend = self._init_backend() if self.enabled else None
+        self._semantic = self._init_semantic() if self.enabled else None
+
+    def _init_backend(self):
+        redis_url = os.getenv('REDIS_URL')
+        if redis_url:
+            try:
+                backend = _RedisBackend(redis_url)
+                logger.info("Analysis cache using Redis backend")
+                return backend
+            except Exception as e:
+                logger.warning(f"Redis cache unavailable: {e}. Trying local cache.")
+        try:
+            backend = _DiskBackend(os.getenv('CACHE_DIR', '.cache'))
+            logger.info("Analysis cache using diskcache backend")
+            return backend
+        except ImportError:
+            logger.info("diskcache not installed, using in-memory analysis cache")
+            return _MemoryBackend(int(os.getenv('ANALYSIS_CACHE_SIZE', 256)))
+
+    def _init_semantic(self) -> Optional[_SemanticIndex]:
+        if os.getenv('SEMANTIC_CACHE', 'false').lower() != 'true':
+            return None
+        try:
+            return _SemanticIndex(int(os.getenv('ANALYSIS_CACHE_SIZE', 256)))
+        except Exception as e:
+            logger.warning(f"Semantic cache disabled: {e}")
+            return None
+
+    def get(self, key: str, cv_content: str = "", target_role: str = "", model: str = 'default',
+            extraction_method: str = 'default') -> Optional[AnalysisState]:
+        """
+        Return the cached analysis for a key, or None on a miss.
+
+        The role, model and extraction method must be the ones the key was
+        built from; near-duplicate CVs only match analyses made with the same ones.
+        """
+        if not self.enabled:
+            return None
+        try:
+            value = self._backend.get(key)
+            if value is None and self._semantic and cv_content:
+                similar_key = self._semantic.lookup(cv_content, target_role,
+                                                    _semantic_scope(target_role, model, extraction_method))
+                if similar_key:
+                    value = self._backend.get(similar_key)
+                    if value is None:
+                        self._semantic.discard(similar_key)
+            if value is None:
+                return None
+            logger.info("Analysis cache hit")
+            return pickle.loads(value)
+        except Exception as e:
+            logger.warning(f"Analysis cache lookup failed: {e}")
+            return None
+
+    def set(self, key: str, result: AnalysisState, cv_content: str = "", target_role: str = "",
+            model: str = 'default', extraction_method: str = 'default') -> None:
+        """Store a completed analysis. Failed analyses are never cached."""
+        if not self.enabled or not result.final_report:
+            return
+        try:
+            self._backend.set(key, pickle.dumps(result), self.ttl)
+            if self._semantic and cv_content:
+                self._semantic.add(key, cv_content, target_role,
+                                   _semantic_scope(target_role, model, extraction_method))
+        except Exception as e:
+            logger.warning(f"Analysis cache store failed: {e}")
@@ -0,0 +1,157 @@
+"""
+Session registry for web analyses.
+Keeps each analysis' status and report path outside the server process so
+sessions survive restarts and can be looked up from any worker.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _SqliteBackend:
+    """Local session table, shared by every process on the host through WAL mode."""
+
+    def __init__(self, db_path: str):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "session_id TEXT PRIMARY KEY, status TEXT, info_json TEXT, created REAL)"
+            )
+
+    def create(self, session_id: str, info: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?)",
+                (session_id, info.get('status'), json.dumps(info), time.time())
+            )
+
+    def update(self, session_id: str, fields: Dict[str, Any]) -> None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT info_json FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if row is None:
+                return
+            info = json.loads(row[0])
+            info.update(fields)
+            self._conn.execute(
+                "UPDATE sessions SET status = ?, info_json = ? WHERE session_id = ?",
+                (info.get('status'), json.dumps(info), session_id)
+            )
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT info_json FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def purge(self, cutoff: float, stale_cutoff: float) -> int:
+        # Queued or running rows that old belong to a server that died mid-analysis
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE (created < ? AND status IN ('completed', 'failed')) "
+                "OR (created < ? AND status NOT IN ('completed', 'failed'))",
+                (cutoff, stale_cutoff)
+            )
+        return cursor.rowcount
+
+
+class _RedisBackend:
+    """Shared session hashes for deployments spread over several hosts."""
+
+    def __init__(self, redis_url: str, ttl: int):
+        import redis
+        self._client = redis.Redis.from_url(redis_url)
+        self._client.ping()
+        self._ttl = ttl
+
+    def create(self, session_id: str, info: Dict[str, Any]) -> None:
+        key = f"session:{session_id}"
+        pipe = self._client.pipeline()
+        pipe.delete(key)
+        pipe.hset(key, mapping={name: json.dumps(value) for name, value in info.items()})
+        pipe.expire(key, self._ttl)
+        pipe.execute()
+
+    def update(self, session_id: str, fields: Dict[str, Any]) -> None:
+        key = f"session:{session_id}"
+        if self._client.exists(key):
+            self._client.hset(key, mapping={name: json.dumps(value) for name, value in fields.items()})
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        info = self._client.hgetall(f"session:{session_id}")
+        if not info:
+            return None
+        return {name.decode('utf-8'): json.loads(value) for name, value in info.items()}
+
+    def purge(self, cutoff: float, stale_cutoff: float) -> int:
+        # Redis expires session hashes on its own
+        return 0
+
+
+class SessionStore:
+    """
+    Registry of analysis sessions.
+
+    Sessions are stored as JSON in Redis (REDIS_URL) when it is reachable,
+    otherwise in a SQLite database under CACHE_DIR. Finished sessions are
+    dropped after SESSION_TTL seconds; their reports stay on disk. Sessions
+    never finished, e.g. because the server was killed mid-analysis, are
+    dropped after the longer SESSION_STALE_TTL.
+    """
+
+    def __init__(self):
+        self.ttl = int(os.getenv('SESSION_TTL', 86400))
+        self.stale_ttl = max(int(os.getenv('SESSION_STALE_TTL', 604800)), self.ttl)
+        self._backend = self._init_backend()
+
+    def _init_backend(self):
+        redis_url = os.getenv('REDIS_URL')
+        if redis_url:
+            try:
+                backend = _RedisBackend(redis_url, self.ttl)
+                logger.info("Session store using Redis backend")
+                return backend
+            except Exception as e:
+                logger.warning(f"Redis session store unavailable: {e}. Using SQLite.")
+        db_path = Path(os.getenv('CACHE_DIR', '.cache')) / 'sessions.db'
+        logger.info(f"Session store using SQLite database {db_path}")
+        return _SqliteBackend(str(db_path))
+
+    def create(self, session_id: str, info: Dict[str, Any]) -> None:
+        """Register a new session with its initial info."""
+        self._backend.create(session_id, info)
+
+    def update(self, session_id: str, **fields: Any) -> None:
+        """Merge fields into a session's info. Unknown sessions are ignored."""
+        try:
+            self._backend.update(session_id, fields)
+        except Exception as e:
+            logger.warning(f"Failed to update session {session_id}: {e}")
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return a session's info, or None if it is unknown or has expired."""
+        try:
+            return self._backend.get(session_id)
+        except Exception as e:
+            logger.warning(f"Session lookup failed for {session_id}: {e}")
+            return None
+
+    def purge_expired(self) -> int:
+        """Delete finished sessions older than the TTL, and unfinished ones older than
+        the stale TTL, and return how many were removed."""
+        now = time.time()
+        return self._backend.purge(now - self.ttl, now - self.stale_ttl)
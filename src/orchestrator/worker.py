@@ -0,0 +1,78 @@
+"""
+Process-pool entry points for the web server.
+Runs the CPU-bound analysis workflow outside the server process and reports
+agent progress and log records back to it through a queue.
+"""
+
+import os
+import logging
+import logging.handlers
+from typing import Any, Dict
+
+from .workflow import compiled_workflow, run_analysis
+from ..agents.cv_parser import load_spacy_model
+from ..schemas import AnalysisState
+
+logger = logging.getLogger(__name__)
+
+
+def init_worker(log_level: int) -> None:
+    """
+    Prepare a freshly started worker process.
+
+    Log records are shipped to the server process, which prints them and
+    streams them to the client, so handlers inherited from it are dropped.
+
+    Args:
+        log_level: Root log level of the server process
+    """
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.setLevel(log_level)
+    warm_up()
+
+
+def warm_up() -> None:
+    """
+    Pay one-off startup costs before the first analysis reaches this process.
+
+    Compiles the shared workflow graph so LangGraph's lazy imports are loaded,
+    and loads the spaCy model when PRELOAD_SPACY is enabled.
+    """
+    try:
+        compiled_workflow()
+        if os.getenv('PRELOAD_SPACY', 'false').lower() == 'true':
+            load_spacy_model()
+    except Exception as e:
+        logger.warning(f"Worker warm-up failed: {e}")
+
+
+def run_workflow(cv_text: str, target_role: str, workflow_env: Dict[str, str], events: Any) -> AnalysisState:
+    """
+    Run the analysis workflow in a worker process.
+
+    Args:
+        cv_text: Raw CV content
+        target_role: Target job role
+        workflow_env: Environment flags selecting the agents' behaviour
+        events: Queue receiving ('agent_start' | 'agent_end', agent_id) tuples
+            and log records while the workflow runs
+
+    Returns:
+        Final analysis state
+    """
+    os.environ.update(workflow_env)
+
+    handler = logging.handlers.QueueHandler(events)
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    try:
+        return run_analysis(
+            cv_text,
+            target_role,
+            on_agent_start=lambda agent_id: events.put(('agent_start', agent_id)),
+            on_agent_end=lambda agent_id: events.put(('agent_end', agent_id))
+        )
+    finally:
+        root_logger.removeHandler(handler)
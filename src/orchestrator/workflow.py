@@ -7,10 +7,14 @@ Coordinates CV Parser → Skill Analyst → Market Intelligence → Report Gener
 import os
 import logging
 import time
-from typing import Dict, Any
+import functools
+from typing import Dict, Any, Callable, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime
 from langgraph.graph import StateGraph, END
-from ..schemas import AnalysisState
+from ..schemas import AnalysisState, SummaryStats
 from ..agents.cv_parser import CVParserAgent
 from ..agents.skill_analyst import SkillAnalystAgent  
 from ..agents.market_intelligence import MarketIntelligenceAgent
@@ -18,6 +22,29 @@ from ..agents.report_generator import ReportGeneratorAgent
 
 logger = logging.getLogger(__name__)
 
+# Callback invoked with an agent identifier when that agent starts or finishes
+AgentCallback = Callable[[str], None]
+
+# Graph nodes and the agent identifiers reported to callers
+AGENT_NODES = {
+    'parse_cv': 'cv_parser',
+    'analyze_skills': 'skill_analyst',
+    'gather_market_intel': 'market_intelligence',
+    'generate_report': 'report_generator'
+}
+
+
+@dataclass(frozen=True)
+class RunHooks:
+    """Per-run extras for the graph nodes, kept out of the graph so it can be compiled once."""
+    on_agent_start: Optional[AgentCallback] = None
+    on_agent_end: Optional[AgentCallback] = None
+    market_intel: Optional[Future] = None
+
+
+# Hooks of the analysis running in the current context
+_run_hooks: ContextVar[RunHooks] = ContextVar('workflow_run_hooks', default=RunHooks())
+
 
 # Environment Configuration
 def _log_environment_config() -> None:
@@ -120,12 +147,14 @@ def analyze_skills(state: AnalysisState) -> AnalysisState:
         return state
 
 
-def gather_market_intel(state: AnalysisState) -> AnalysisState:
+def gather_market_intel(state: AnalysisState, prefetched: Optional[Future] = None) -> AnalysisState:
     """
     Market Intelligence node with error handling and state validation.
     
     Args:
         state: Analysis state with target role
+        prefetched: Optional future of a market intelligence run started before the
+            graph reached this node (see prefetch_market_intel)
         
     Returns:
         Updated state with market intelligence data
@@ -140,9 +169,16 @@ def gather_market_intel(state: AnalysisState) -> AnalysisState:
             state.add_error("Prerequisites missing: target role required")
             return state
         
-        # Execute market intelligence
-        market_agent = MarketIntelligenceAgent()
-        result_state = market_agent.run(state)
+        # Execute market intelligence, or pick up the run that started with the pipeline
+        if prefetched is not None:
+            market_state = prefetched.result()
+            state.market_intelligence = market_state.market_intelligence
+            for error in market_state.errors:
+                state.add_error(error)
+            result_state = state
+        else:
+            market_agent = MarketIntelligenceAgent()
+            result_state = market_agent.run(state)
         
         # Log execution time
         execution_time = time.time() - start_time
@@ -209,6 +245,48 @@ def generate_report(state: AnalysisState) -> AnalysisState:
         logger.error(f"{error_msg}")
         state.add_error(error_msg)
         return state
+    
+    finally:
+        # Summary counts are recorded however the node exits (the agent updates state in place)
+        state.summary_stats = SummaryStats.from_state(state)
+
+
+def prefetch_market_intel(target_role: str) -> AnalysisState:
+    """
+    Gather market intelligence for a role on a state of its own.
+    
+    Market intelligence depends only on the target role, so run_analysis starts
+    it alongside CV parsing and skill analysis; the graph node then collects it.
+    
+    Args:
+        target_role: Target job role
+        
+    Returns:
+        State holding only the market intelligence and any errors
+    """
+    return MarketIntelligenceAgent().run(AnalysisState(target_role=target_role))
+
+
+def _collect_market_intel(state: AnalysisState) -> AnalysisState:
+    """Market Intelligence node using the current run's prefetched result, if any."""
+    return gather_market_intel(state, _run_hooks.get().market_intel)
+
+
+def _track_agent(node_fn: Callable[[AnalysisState], AnalysisState],
+                 agent_id: str) -> Callable[[AnalysisState], AnalysisState]:
+    """Wrap a node function so the current run's callbacks hear when its agent starts and finishes."""
+    @functools.wraps(node_fn)
+    def tracked(state: AnalysisState) -> AnalysisState:
+        hooks = _run_hooks.get()
+        if hooks.on_agent_start:
+            hooks.on_agent_start(agent_id)
+        try:
+            return node_fn(state)
+        finally:
+            if hooks.on_agent_end:
+                hooks.on_agent_end(agent_id)
+    
+    return tracked
 
 
 # Graph Construction
@@ -216,22 +294,29 @@ def create_workflow() -> StateGraph:
     """
     Create and configure the LangGraph workflow.
     
+    Agent callbacks and prefetched market intelligence are read from the
+    running analysis' RunHooks, so the graph holds no per-run state.
+    
     Returns:
         Configured StateGraph for CV analysis pipeline
     """
     logger.info("Building LangGraph workflow...")
     
-    # Log environment configuration
-    _log_environment_config()
-    
     # Create workflow graph
     workflow = StateGraph(AnalysisState)
     
     # Add nodes for each agent
-    workflow.add_node("parse_cv", parse_cv)
-    workflow.add_node("analyze_skills", analyze_skills)
-    workflow.add_node("gather_market_intel", gather_market_intel)
-    workflow.add_node("generate_report", generate_report)
+    nodes = {
+        "parse_cv": parse_cv,
+        "analyze_skills": analyze_skills,
+        "gather_market_intel": _collect_market_intel,
+        "generate_report": generate_report
+    }
+    for node_name, node_fn in nodes.items():
+        workflow.add_node(
+            node_name,
+            _track_agent(node_fn, AGENT_NODES[node_name])
+        )
     
     # Define execution flow
     workflow.add_edge("parse_cv", "analyze_skills")
@@ -246,14 +331,29 @@ def create_workflow() -> StateGraph:
     return workflow
 
 
+@functools.lru_cache(maxsize=1)
+def compiled_workflow():
+    """
+    Return the compiled workflow, building it on first use.
+    
+    Returns:
+        Compiled LangGraph application shared by every analysis in the process
+    """
+    return create_workflow().compile()
+
+
 # Main Execution Function
-def run_analysis(cv_text: str, target_role: str) -> AnalysisState:
+def run_analysis(cv_text: str, target_role: str,
+                 on_agent_start: Optional[AgentCallback] = None,
+                 on_agent_end: Optional[AgentCallback] = None) -> AnalysisState:
     """
     Main entry point for CV analysis pipeline.
     
     Args:
         cv_text: Raw CV text content
         target_role: Target job role for analysis
+        on_agent_start: Optional callback invoked with the agent id when an agent starts
+        on_agent_end: Optional callback invoked with the agent id when an agent finishes
         
     Returns:
         Final analysis state with complete results
@@ -263,20 +363,30 @@ def run_analysis(cv_text: str, target_role: str) -> AnalysisState:
     logger.info(f"   Target Role: {target_role}")
     logger.info(f"   CV Content Length: {len(cv_text)} characters")
     
+    # Log environment configuration
+    _log_environment_config()
+    
     try:
-        # Create and compile workflow
-        workflow = create_workflow()
-        app = workflow.compile()
-        
-        # Initialize state
-        initial_state = AnalysisState(
-            cv_raw=cv_text,
-            target_role=target_role
-        )
-        
-        # Execute pipeline
-        logger.info("Executing pipeline...")
-        result_dict = app.invoke(initial_state)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='market-intel') as executor:
+            # Market API calls overlap with CV parsing and skill analysis
+            market_intel = executor.submit(prefetch_market_intel, target_role) if target_role.strip() else None
+            
+            # The compiled graph is shared; this run's callbacks travel in the context
+            app = compiled_workflow()
+            hooks_token = _run_hooks.set(RunHooks(on_agent_start, on_agent_end, market_intel))
+            
+            # Initialize state
+            initial_state = AnalysisState(
+                cv_raw=cv_text,
+                target_role=target_role
+            )
+            
+            # Execute pipeline
+            logger.info("Executing pipeline...")
+            try:
+                result_dict = app.invoke(initial_state)
+            finally:
+                _run_hooks.reset(hooks_token)
         
         # Convert result dict back to AnalysisState object
         result = AnalysisState(**result_dict)
@@ -146,6 +146,30 @@ class MarketIntelligence:
     source: str = "simulation"  # "simulation" or "live_api"
 
 
+@dataclass
+class SummaryStats:
+    """Headline counts of a finished analysis, computed once by the report node."""
+    sections_found: int = 0
+    tech_skills: int = 0
+    implicit_skills: int = 0
+    report_length: int = 0
+
+    @classmethod
+    def from_state(cls, state: "AnalysisState") -> "SummaryStats":
+        """Count the parsed CV sections, skills and report size of a state."""
+        cv = state.cv_structured
+        skills = cv.skills
+        has_skills = skills.languages or skills.frameworks or skills.tools
+        sections_found = sum(1 for section in (cv.personal.name, cv.experience, has_skills, cv.education, cv.projects)
+                             if section)
+        return cls(
+            sections_found=sections_found,
+            tech_skills=len(state.skills_analysis.explicit_skills.get('tech', [])),
+            implicit_skills=len(state.skills_analysis.implicit_skills),
+            report_length=len(state.final_report or "")
+        )
+
+
 @dataclass
 class AnalysisState:
     """Main state object for the analysis workflow."""
@@ -155,6 +179,7 @@ class AnalysisState:
     market_intelligence: MarketIntelligence = field(default_factory=MarketIntelligence)
     target_role: str = ""
     final_report: str = ""
+    summary_stats: Optional[SummaryStats] = None
     errors: List[str] = field(default_factory=list)
     
     def add_error(self, error: str) -> None: